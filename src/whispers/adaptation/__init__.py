@@ -1,9 +1,35 @@
-"""Minimal adaptation stubs for tests."""
+"""Minimal adaptation baselines for tests."""
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence
+from typing import Iterable, List, Sequence, Union
+
+import numpy as np
+
+from ..agents.agent_pool import HARVEST_WINDOW, AgentPool
+from ..rng import shared_rng
+
+# The four strategy parameters, in column order, with their per-column
+# mutation scales (matching the historical random.uniform ranges).
+_STRATEGY_FIELDS = (
+    "request_multiplier",
+    "negotiation_demand",
+    "acceptance_threshold",
+    "greed_index",
+)
+_MUTATION_SCALES = np.array([0.1, 0.05, 0.05, 0.1], dtype=np.float32)
+
+
+def _personality_classes() -> dict:
+    # Served from the late-bound registry the personalities package fills
+    # in at import time; one import on first use, dict lookups after.
+    from ..agents.base_agent import BaseAgent
+
+    if not BaseAgent._TYPE_REGISTRY:
+        from ..agents import personalities  # noqa: F401 - populates registry
+
+    return BaseAgent._TYPE_REGISTRY
 
 
 @dataclass
@@ -15,30 +41,164 @@ class EvolutionConfig:
 class Evolution:
     def __init__(self, config: EvolutionConfig | None = None) -> None:
         self.config = config or EvolutionConfig()
+        self._rng = shared_rng().generator
+
+    def reproduce(
+        self, agents: Union[AgentPool, Sequence[object], None]
+    ) -> Union[List[object], np.ndarray]:
+        # Pool path: operate directly on index arrays, no object iteration.
+        if isinstance(agents, AgentPool):
+            return self._reproduce_pool(agents)
+        # Baseline (max_offspring_per_day == 0): no reproduction
+        if not agents or self.config.max_offspring_per_day <= 0:
+            return []
+
+        parents = [agent for agent in agents if agent.can_reproduce()]
+        if not parents:
+            return []
+        # Enforce the daily cap: at most max_offspring_per_day children.
+        parents = parents[: self.config.max_offspring_per_day]
 
-    def reproduce(self, agents: Sequence[object]) -> List[object]:
-        # No reproduction in baseline; return empty list
-        return []
+        # Batch-sample every random draw for this tick in three vectorized
+        # calls instead of ~5 Python-level PRNG calls per parent.
+        n = len(parents)
+        deltas = (
+            self._rng.random((n, 4), dtype=np.float32) * 2.0 - 1.0
+        ) * _MUTATION_SCALES
+        mutates = self._rng.random(n) < self.config.mutation_rate
+        flips = self._rng.random(n)
+
+        classes = _personality_classes()
+        offspring: List[object] = []
+        for i, parent in enumerate(parents):
+            alternatives = [
+                cls for name, cls in classes.items() if name != parent.agent_type
+            ]
+            if mutates[i] and len(alternatives) >= 2:
+                child = alternatives[0]() if flips[i] < 0.5 else alternatives[1]()
+            else:
+                params = {
+                    field: getattr(parent.state, field) + deltas[i, j]
+                    for j, field in enumerate(_STRATEGY_FIELDS)
+                }
+                child = type(parent)(**params)
+            parent.charge_reproduction_cost()
+            offspring.append(child)
+        return offspring
+
+    def _reproduce_pool(self, pool: AgentPool) -> np.ndarray:
+        """
+        Vectorized reproduction over a whole pool.
+
+        Eligible parents are found with one mask; offspring rows inherit the
+        parent's columns with batch-sampled strategy perturbations (the pool
+        carries no personality type, so type mutation stays on the object
+        path). Returns the new row indices.
+        """
+        if self.config.max_offspring_per_day <= 0:
+            return np.empty(0, dtype=np.intp)
+        parents = np.where(pool.can_reproduce_mask())[0]
+        if parents.size == 0:
+            return np.empty(0, dtype=np.intp)
+        # Same daily cap as the object path.
+        parents = parents[: self.config.max_offspring_per_day]
+
+        deltas = (
+            self._rng.random((parents.size, 4), dtype=np.float32) * 2.0 - 1.0
+        ) * _MUTATION_SCALES
+        # Children inherit the parent's personality (type_id) and its
+        # perturbed strategy columns; reputation starts at the pool
+        # default, matching the object path's freshly-constructed clones.
+        children = np.empty(parents.size, dtype=np.intp)
+        for i, parent in enumerate(parents):
+            children[i] = pool.add_agent(
+                type_id=int(pool.type_id[parent]),
+                daily_need=int(pool.daily_need[parent]),
+                reproduction_reserve=int(pool.reproduction_reserve[parent]),
+                reproduction_cost=int(pool.reproduction_cost[parent]),
+                position_x=int(pool.position_x[parent]),
+                position_y=int(pool.position_y[parent]),
+                request_multiplier=float(pool.request_multiplier[parent] + deltas[i, 0]),
+                negotiation_demand=float(pool.negotiation_demand[parent] + deltas[i, 1]),
+                acceptance_threshold=float(pool.acceptance_threshold[parent] + deltas[i, 2]),
+                greed_index=float(pool.greed_index[parent] + deltas[i, 3]),
+            )
+        # Charge every parent's reproduction cost in one vectorized write.
+        pool.resources_reserve[parents] -= pool.reproduction_cost[parents]
+        return children
 
 
 @dataclass
 class ImitationConfig:
     copy_interval_days: int = 0
+    # Softmax temperature over recent performance; higher = greedier copying.
+    kappa: float = 1.0
+    # Performance window in days, capped by the harvest ring-buffer width.
+    k_window: int = 10
 
 
 class Imitation:
     def __init__(self, config: ImitationConfig | None = None) -> None:
         self.config = config or ImitationConfig()
+        self._rng = shared_rng().generator
 
-    def maybe_copy(self, day_index: int, agents: Iterable[object]) -> None:
-        # Baseline no-op
+    def maybe_copy(
+        self, day_index: int, agents: Union[AgentPool, Iterable[object], None]
+    ) -> None:
+        # Baseline (copy_interval_days == 0): no-op
+        interval = self.config.copy_interval_days
+        if interval <= 0 or day_index <= 0 or day_index % interval != 0:
+            return None
+        if isinstance(agents, AgentPool):
+            self._copy_pool(agents)
         return None
 
+    def _copy_pool(self, pool: AgentPool) -> None:
+        """
+        Softmax-weighted strategy copying across the whole pool.
+
+        Every alive agent picks a model in one vectorized draw, weighted by
+        recent average harvest, and adopts its strategy columns; no
+        per-agent Python loop.
+        """
+        n = pool.size
+        if n == 0:
+            return
+        alive = pool.alive[:n]
+        if not alive.any():
+            return
+        k = min(max(self.config.k_window, 1), HARVEST_WINDOW)
+        window = np.minimum(pool.harvest_count[:n], k)
+        if k >= HARVEST_WINDOW:
+            # Whole window requested: the maintained running sum is exact.
+            totals = pool.harvest_sum[:n]
+        else:
+            # Partial window: gather the newest k ring slots per agent
+            # (head points at the next write). Wrapped indices on not-yet-
+            # full rings land in never-written zero slots, so the sums
+            # stay exact with `window` as the divisor.
+            cols = (pool.harvest_head[:n, None] - 1 - np.arange(k)) % HARVEST_WINDOW
+            totals = pool.harvest_buf[np.arange(n)[:, None], cols].sum(axis=1)
+        avg_harvest = totals / np.maximum(window, 1)
+        # Numerically stable softmax over alive agents only, one pass:
+        # w = exp(kappa * (perf - perf.max())) then normalized.
+        logits = np.where(alive, self.config.kappa * avg_harvest, -np.inf)
+        logits -= logits.max()
+        weights = np.exp(logits)
+        weights /= weights.sum()
+        models = self._rng.choice(n, size=n, p=weights)
+        for column in (
+            pool.request_multiplier,
+            pool.negotiation_demand,
+            pool.acceptance_threshold,
+            pool.greed_index,
+        ):
+            column[:n] = np.where(alive, column[models], column[:n])
+        pool.refresh_desired_intake()
+
 __all__ = [
     "EvolutionConfig",
     "Evolution",
     "ImitationConfig",
     "Imitation",
 ]
-
-
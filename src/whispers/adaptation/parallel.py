@@ -0,0 +1,162 @@
+"""
+Parallel execution of independent simulation replicates.
+
+Replicate runs share no mutable state, so they are distributed across
+processes (not threads) to bypass the GIL. Each worker seeds its own RNG
+stream and returns a compact NumPy result array rather than pickled
+agent objects.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..agents.agent_pool import AgentPool
+from ..rng import reseed
+from ..simulation.simulation import Simulation, SimulationConfig
+
+
+def _run_one(args) -> np.ndarray:
+    """Worker: run one seeded replicate, return per-day alive counts."""
+    seed, config, agent_counts = args
+    reseed(seed)
+    from ..agents.personalities import Altruist, Egoist, Pragmatist
+
+    classes = {"altruist": Altruist, "egoist": Egoist, "pragmatist": Pragmatist}
+    agents = [
+        classes[agent_type]()
+        for agent_type, count in agent_counts.items()
+        for _ in range(count)
+    ]
+    sim = Simulation(agents=agents, config=config)
+    sim.run()
+    return np.array(
+        [record["agents_alive"] for record in sim.metrics.daily], dtype=np.int32
+    )
+
+
+def run_replicates(
+    config: SimulationConfig,
+    agent_counts: Dict[str, int],
+    seeds: Sequence[int],
+    n_workers: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Run independent replicates across processes.
+
+    Args:
+        config: Shared run configuration.
+        agent_counts: Initial population per agent type, e.g.
+            ``{"altruist": 10, "egoist": 5}``.
+        seeds: One RNG seed per replicate.
+        n_workers: Worker processes; defaults to the CPU count.
+
+    Returns:
+        Array of shape (len(seeds), num_days) of per-day alive counts.
+    """
+    jobs = [(seed, config, agent_counts) for seed in seeds]
+    if len(jobs) <= 1:
+        results: List[np.ndarray] = [_run_one(job) for job in jobs]
+    else:
+        workers = n_workers if n_workers is not None else os.cpu_count()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_run_one, jobs))
+    return np.stack(results) if results else np.empty((0, config.num_days), np.int32)
+
+
+class SharedPoolColumns:
+    """
+    Snapshot of selected AgentPool columns in one shared-memory block.
+
+    Worker processes reattach through `attach(handle)` and read the
+    columns zero-copy, so population-scale analyses fan out without
+    pickling arrays per task. The snapshot holds only live rows and is
+    read-only by convention: writes land in the shared copy, not the
+    originating pool.
+    """
+
+    def __init__(self, pool: AgentPool, columns: Sequence[str]) -> None:
+        live = [getattr(pool, name)[: pool.size] for name in columns]
+        total = sum(column.nbytes for column in live)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(total, 1))
+        spec = []
+        offset = 0
+        for name, column in zip(columns, live):
+            view = np.ndarray(
+                column.shape, column.dtype, buffer=self._shm.buf, offset=offset
+            )
+            view[...] = column
+            spec.append((name, column.dtype.str, column.shape, offset))
+            offset += column.nbytes
+        #: Picklable description workers pass to `attach`.
+        self.handle: Tuple[str, tuple] = (self._shm.name, tuple(spec))
+
+    @staticmethod
+    def attach(handle) -> Tuple[shared_memory.SharedMemory, Dict[str, np.ndarray]]:
+        """
+        Reattach the columns in a worker process.
+
+        Returns the backing SharedMemory (keep it referenced while the
+        arrays are in use, then close it) and a name-to-array mapping.
+        """
+        name, spec = handle
+        shm = shared_memory.SharedMemory(name=name)
+        arrays = {
+            field: np.ndarray(shape, np.dtype(dtype), buffer=shm.buf, offset=offset)
+            for field, dtype, shape, offset in spec
+        }
+        return shm, arrays
+
+    def close(self) -> None:
+        """Release this process's mapping and the underlying block."""
+        self._shm.close()
+        self._shm.unlink()
+
+
+def map_pool_chunks(
+    worker: Callable[[Tuple[str, tuple], int, int], object],
+    pool: AgentPool,
+    columns: Sequence[str],
+    n_workers: Optional[int] = None,
+) -> List[object]:
+    """
+    Fan a per-agent computation out over row chunks in processes.
+
+    The selected columns are exported once into shared memory; each worker
+    gets the handle plus its [start, stop) row range and reattaches with
+    `SharedPoolColumns.attach`. `worker` must be a module-level callable
+    (it crosses the process boundary by pickle).
+
+    Args:
+        worker: Callable invoked as ``worker(handle, start, stop)``.
+        pool: Source pool; only live rows are exported.
+        columns: Pool column names to share.
+        n_workers: Process count; defaults to the CPU count.
+
+    Returns:
+        The per-chunk results, in row order.
+    """
+    n = pool.size
+    if n == 0:
+        return []
+    workers = n_workers if n_workers is not None else (os.cpu_count() or 1)
+    bounds = np.linspace(0, n, min(workers, n) + 1).astype(int)
+    ranges = [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+    shared = SharedPoolColumns(pool, columns)
+    try:
+        if len(ranges) <= 1:
+            return [worker(shared.handle, start, stop) for start, stop in ranges]
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            handles = [shared.handle] * len(ranges)
+            starts, stops = zip(*ranges)
+            return list(executor.map(worker, handles, starts, stops))
+    finally:
+        shared.close()
+
+
+__all__ = ["run_replicates", "SharedPoolColumns", "map_pool_chunks"]
@@ -5,8 +5,9 @@ This package contains the core agent classes and simulation logic for studying
 how micro-level interactions shape macro-level social phenomena.
 """
 
+from .agent_pool import AgentPool, default_pool
 from .base_agent import BaseAgent
 from .personalities import Altruist, Egoist, Pragmatist
 
 __version__ = "0.1.0"
-__all__ = ["BaseAgent", "Altruist", "Egoist", "Pragmatist"]
+__all__ = ["AgentPool", "default_pool", "BaseAgent", "Altruist", "Egoist", "Pragmatist"]
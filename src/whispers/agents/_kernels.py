@@ -0,0 +1,224 @@
+"""
+Hot per-day update kernels over the AgentPool's SoA columns.
+
+When Numba is installed the kernels are JIT-compiled explicit loops
+(`njit(cache=True, parallel=True)`, compiled artifacts cached on disk so
+the compile cost is paid once per machine, not per run). Numba is an
+optional dependency: without it the same entry points fall back to
+vectorized NumPy expressions, so behavior is identical either way.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+if os.environ.get("WHISPERS_DISABLE_JIT"):  # debugging escape hatch
+    njit = None
+    prange = range
+    HAVE_NUMBA = False
+else:
+    try:
+        from numba import njit, prange
+
+        HAVE_NUMBA = True
+    except ImportError:  # pragma: no cover - exercised only without numba
+        njit = None
+        prange = range
+        HAVE_NUMBA = False
+
+
+def _upkeep_loop(alive, reserve, daily_need, n):
+    for i in prange(n):
+        if alive[i] and reserve[i] < daily_need[i]:
+            alive[i] = False
+
+
+def _desired_intake_loop(daily_need, request_multiplier, out, n):
+    for i in prange(n):
+        want = int(round(daily_need[i] * request_multiplier[i]))
+        out[i] = want if want > daily_need[i] else daily_need[i]
+
+
+def _negotiate_demand_loop(negotiation_demand, greed_index, partner_reputation, out, n):
+    for i in prange(n):
+        demand = negotiation_demand[i] + greed_index[i] * (0.5 - partner_reputation[i])
+        if demand < 0.0:
+            demand = 0.0
+        elif demand > 1.0:
+            demand = 1.0
+        out[i] = demand
+
+
+def _accept_offer_loop(acceptance_threshold, soft_threshold, soft_prob, u, alive, offers, out, n):
+    for i in prange(n):
+        # Branch-free in compiled form: both comparisons evaluate to flags
+        # that combine with and/or, no data-dependent control flow.
+        hard = offers[i] >= acceptance_threshold[i]
+        soft = offers[i] >= soft_threshold[i] and u[i] < soft_prob[i]
+        out[i] = alive[i] and (hard or soft)
+
+
+def _run_day_loop(desired_intake, negotiation_demand, greed_index,
+                  acceptance_threshold, soft_threshold, soft_prob, reputation,
+                  alive, partner_idx, u, available,
+                  out_request, out_demand, out_accept, n):
+    # One fused pass: each agent's request, demand, and acceptance are
+    # computed while its trait row is hot in L1, instead of streaming the
+    # same columns through cache three times in separate kernels.
+    for i in prange(n):
+        request = desired_intake[i]
+        if request > available:
+            request = available
+        if request < 0:
+            request = 0
+        out_request[i] = request
+
+        j = partner_idx[i]
+        demand = negotiation_demand[i] + greed_index[i] * (0.5 - reputation[j])
+        if demand < 0.0:
+            demand = 0.0
+        elif demand > 1.0:
+            demand = 1.0
+        out_demand[i] = demand
+
+        partner_demand = negotiation_demand[j] + greed_index[j] * (0.5 - reputation[i])
+        if partner_demand < 0.0:
+            partner_demand = 0.0
+        elif partner_demand > 1.0:
+            partner_demand = 1.0
+        my_share = 1.0 - partner_demand
+        hard = my_share >= acceptance_threshold[i]
+        soft = my_share >= soft_threshold[i] and u[i] < soft_prob[i]
+        out_accept[i] = alive[i] and alive[j] and (hard or soft)
+
+
+def _age_step_loop(age, alive, indices, n):
+    # Fused daily aging: bump age for live rows and count the living in
+    # the same pass, so the driver needs one kernel call per day instead
+    # of a gather, a scatter-add and a reduction.
+    count = 0
+    for k in prange(n):
+        i = indices[k]
+        is_alive = alive[i]
+        age[i] += is_alive
+        count += is_alive
+    return count
+
+
+def _run_days_loop(num_days, age, alive, indices, n, out_counts):
+    # Whole-run fusion of the daily aging pass: all D days execute inside
+    # one compiled call, so each agent's row stays hot across days instead
+    # of being streamed through cache once per day from Python.
+    for d in range(num_days):
+        count = 0
+        for k in prange(n):
+            i = indices[k]
+            is_alive = alive[i]
+            age[i] += is_alive
+            count += is_alive
+        out_counts[d] = count
+
+
+def _upkeep_numpy(alive, reserve, daily_need, n):
+    np.bitwise_and(alive[:n], reserve[:n] >= daily_need[:n], out=alive[:n])
+
+
+def _desired_intake_numpy(daily_need, request_multiplier, out, n):
+    want = np.rint(daily_need[:n] * request_multiplier[:n]).astype(out.dtype)
+    np.maximum(want, daily_need[:n], out=out[:n])
+
+
+def _negotiate_demand_numpy(negotiation_demand, greed_index, partner_reputation, out, n):
+    np.add(
+        negotiation_demand[:n],
+        greed_index[:n] * (0.5 - partner_reputation[:n]),
+        out=out[:n],
+    )
+    np.clip(out[:n], 0.0, 1.0, out=out[:n])
+
+
+def _accept_offer_numpy(acceptance_threshold, soft_threshold, soft_prob, u, alive, offers, out, n):
+    np.greater_equal(offers[:n], acceptance_threshold[:n], out=out[:n])
+    soft = (offers[:n] >= soft_threshold[:n]) & (u[:n] < soft_prob[:n])
+    np.bitwise_or(out[:n], soft, out=out[:n])
+    np.bitwise_and(out[:n], alive[:n], out=out[:n])
+
+
+def _age_step_numpy(age, alive, indices, n):
+    is_alive = alive[indices]
+    age[indices] += is_alive
+    return int(is_alive.sum())
+
+
+def _run_days_numpy(num_days, age, alive, indices, n, out_counts):
+    # Liveness cannot change inside this driver's day loop, so D days of
+    # aging collapse into one scaled scatter-add and a constant count.
+    is_alive = alive[indices]
+    age[indices] += is_alive.astype(age.dtype) * num_days
+    out_counts[:num_days] = int(is_alive.sum())
+
+
+def _run_day_numpy(desired_intake, negotiation_demand, greed_index,
+                   acceptance_threshold, soft_threshold, soft_prob, reputation,
+                   alive, partner_idx, u, available,
+                   out_request, out_demand, out_accept, n):
+    np.clip(desired_intake[:n], 0, available, out=out_request[:n])
+
+    partner_rep = reputation[partner_idx[:n]]
+    np.add(negotiation_demand[:n], greed_index[:n] * (0.5 - partner_rep),
+           out=out_demand[:n])
+    np.clip(out_demand[:n], 0.0, 1.0, out=out_demand[:n])
+
+    j = partner_idx[:n]
+    partner_demand = np.clip(
+        negotiation_demand[j] + greed_index[j] * (0.5 - reputation[:n]), 0.0, 1.0
+    )
+    my_share = 1.0 - partner_demand
+    np.greater_equal(my_share, acceptance_threshold[:n], out=out_accept[:n])
+    soft = (my_share >= soft_threshold[:n]) & (u[:n] < soft_prob[:n])
+    np.bitwise_or(out_accept[:n], soft, out=out_accept[:n])
+    np.bitwise_and(out_accept[:n], alive[:n], out=out_accept[:n])
+    np.bitwise_and(out_accept[:n], alive[j], out=out_accept[:n])
+
+
+# A prebuilt AOT extension (see `_kernels_aot`) takes precedence: it ships
+# the same loops as native code, so process start pays no JIT cost at all.
+HAVE_AOT = False
+if not os.environ.get("WHISPERS_DISABLE_JIT"):
+    try:
+        from whispers_kernels import (  # noqa: F401
+            accept_offer_kernel,
+            desired_intake_kernel,
+            negotiate_demand_kernel,
+            run_day_kernel,
+            upkeep_kernel,
+        )
+
+        HAVE_AOT = True
+    except ImportError:
+        pass
+
+if HAVE_AOT:
+    pass
+elif HAVE_NUMBA:
+    upkeep_kernel = njit(cache=True, parallel=True)(_upkeep_loop)
+    desired_intake_kernel = njit(cache=True, parallel=True)(_desired_intake_loop)
+    negotiate_demand_kernel = njit(cache=True, parallel=True)(_negotiate_demand_loop)
+    accept_offer_kernel = njit(cache=True, parallel=True)(_accept_offer_loop)
+    run_day_kernel = njit(cache=True, parallel=True)(_run_day_loop)
+else:
+    upkeep_kernel = _upkeep_numpy
+    desired_intake_kernel = _desired_intake_numpy
+    negotiate_demand_kernel = _negotiate_demand_numpy
+    accept_offer_kernel = _accept_offer_numpy
+    run_day_kernel = _run_day_numpy
+
+# Not part of the AOT export set (reduction-returning / driver-shaped).
+if HAVE_NUMBA:
+    age_step_kernel = njit(cache=True, parallel=True)(_age_step_loop)
+    run_days_kernel = njit(cache=True, parallel=True)(_run_days_loop)
+else:
+    age_step_kernel = _age_step_numpy
+    run_days_kernel = _run_days_numpy
@@ -0,0 +1,60 @@
+"""
+Optional ahead-of-time build of the per-day agent kernels.
+
+`cache=True` JIT still pays a multi-second cold compile on the first run
+per machine; short demo runs (rich visualization, CI) eat that cost every
+time the cache is invalidated. Running
+
+    python -m whispers.agents._kernels_aot
+
+in an environment with Numba compiles the same loop bodies from
+`_kernels` into a platform-specific `whispers_kernels` extension; the
+dispatch in `_kernels` imports that first and only falls back to JIT (or
+plain NumPy) when no prebuilt extension is on the path. The AOT build is
+strictly optional — nothing at runtime requires it.
+"""
+
+from __future__ import annotations
+
+from ._kernels import (
+    _accept_offer_loop,
+    _desired_intake_loop,
+    _negotiate_demand_loop,
+    _run_day_loop,
+    _upkeep_loop,
+)
+
+try:
+    from numba.pycc import CC
+except ImportError:  # pragma: no cover - exercised only without numba
+    CC = None
+
+if CC is not None:
+    cc = CC("whispers_kernels")
+    cc.export("upkeep_kernel", "void(b1[:], i4[:], i4[:], i8)")(_upkeep_loop)
+    cc.export(
+        "desired_intake_kernel", "void(i4[:], f4[:], i4[:], i8)"
+    )(_desired_intake_loop)
+    cc.export(
+        "negotiate_demand_kernel", "void(f4[:], f4[:], f4[:], f4[:], i8)"
+    )(_negotiate_demand_loop)
+    cc.export(
+        "accept_offer_kernel",
+        "void(f4[:], f4[:], f4[:], f4[:], b1[:], f4[:], b1[:], i8)",
+    )(_accept_offer_loop)
+    cc.export(
+        "run_day_kernel",
+        "void(i4[:], f4[:], f4[:], f4[:], f4[:], f4[:], f4[:], b1[:], "
+        "i8[:], f4[:], i8, i4[:], f4[:], b1[:], i8)",
+    )(_run_day_loop)
+
+
+def build() -> None:
+    """Compile the `whispers_kernels` extension in place."""
+    if CC is None:
+        raise RuntimeError("Numba is required to build the AOT kernels")
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
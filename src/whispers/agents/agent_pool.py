@@ -0,0 +1,552 @@
+"""
+Structure-of-Arrays storage for agent state.
+
+This module provides the `AgentPool`, a columnar (SoA) container that holds
+the numeric state of every agent in parallel NumPy arrays. Individual agents
+are thin views onto a row index; population-wide passes (upkeep, reproduction
+eligibility, aging) can then run as vectorized masks over whole columns
+instead of attribute-by-attribute Python loops.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ._kernels import (
+    accept_offer_kernel,
+    desired_intake_kernel,
+    negotiate_demand_kernel,
+    run_day_kernel,
+    upkeep_kernel,
+)
+from ..rng import shared_rng
+
+# Fixed history window sizes (days of memory kept per agent).
+HARVEST_WINDOW = 10
+COOPERATION_WINDOW = 20
+
+# Dense per-type ids used for vectorized dispatch instead of Python MRO
+# lookups; unknown/custom agent types map to -1.
+AGENT_TYPE_IDS = {"altruist": 0, "egoist": 1, "pragmatist": 2}
+
+# Soft-acceptance lookup tables indexed by type_id. A below-threshold offer
+# can still be accepted when it clears `threshold * mult` with probability
+# `prob`. The last row serves type_id == -1 (unknown) through negative
+# indexing: mult 1.0 / prob 0.0 degrades to the plain hard threshold.
+_TYPE_SOFT_MULT = np.array([0.8, 0.95, 0.85, 1.0], dtype=np.float32)
+_TYPE_SOFT_PROB = np.array([0.5, 0.15, 0.35, 0.0], dtype=np.float32)
+
+
+class HistoryView:
+    """
+    Chronological, list-like view over one agent's fixed-size ring buffer.
+
+    Supports `len`, indexing, slicing and iteration in oldest-to-newest
+    order, so callers that treated the old Python-list histories as
+    sequences keep working unchanged.
+    """
+
+    def __init__(self, pool: "AgentPool", index: int, field: str, cast=int):
+        self._pool = pool
+        self._index = index
+        self._field = field
+        self._cast = cast
+
+    def _snapshot(self) -> list:
+        pool, i = self._pool, self._index
+        buf = getattr(pool, self._field + "_buf")
+        head = int(getattr(pool, self._field + "_head")[i])
+        count = int(getattr(pool, self._field + "_count")[i])
+        window = buf.shape[1]
+        if count < window:
+            row = buf[i, :count]
+        else:
+            row = np.concatenate((buf[i, head:], buf[i, :head]))
+        cast = self._cast
+        return [cast(v) for v in row]
+
+    def __len__(self) -> int:
+        return int(getattr(self._pool, self._field + "_count")[self._index])
+
+    def __getitem__(self, item):
+        return self._snapshot()[item]
+
+    def __iter__(self):
+        return iter(self._snapshot())
+
+    def __repr__(self) -> str:
+        return repr(self._snapshot())
+
+
+class AgentPool:
+    """
+    Columnar store for per-agent numeric state.
+
+    Each agent occupies one row index across a set of parallel NumPy arrays:
+    int32 columns for resources, needs and positions, float32 columns for
+    reputation and strategy parameters, and a bool column for liveness.
+    Rows are appended on agent creation and never removed; dead agents are
+    simply masked out by the `alive` column.
+    """
+
+    def __init__(self, capacity: int = 256):
+        """
+        Initialize an empty pool.
+
+        Args:
+            capacity: Initial number of rows to allocate; the pool grows
+                geometrically as agents are added.
+        """
+        self._capacity = max(1, capacity)
+        self.size = 0
+
+        # Survival and reproduction economy (int32)
+        self.resources_reserve = np.zeros(self._capacity, dtype=np.int32)
+        self.daily_need = np.zeros(self._capacity, dtype=np.int32)
+        self.reproduction_reserve = np.zeros(self._capacity, dtype=np.int32)
+        self.reproduction_cost = np.zeros(self._capacity, dtype=np.int32)
+
+        # Age and spatial position (int32)
+        self.age = np.zeros(self._capacity, dtype=np.int32)
+        self.position_x = np.zeros(self._capacity, dtype=np.int32)
+        self.position_y = np.zeros(self._capacity, dtype=np.int32)
+
+        # Liveness mask (bool)
+        self.alive = np.zeros(self._capacity, dtype=np.bool_)
+
+        # Newborn flag (uint8 byte column, like alive: one byte per agent
+        # so population scans stay cache-dense instead of boxed bools)
+        self.newborn = np.zeros(self._capacity, dtype=np.uint8)
+
+        # Personality type id (int8, see AGENT_TYPE_IDS; -1 = unknown)
+        self.type_id = np.full(self._capacity, -1, dtype=np.int8)
+
+        # Reputation and strategy parameters (float32)
+        self.reputation = np.zeros(self._capacity, dtype=np.float32)
+        self.request_multiplier = np.zeros(self._capacity, dtype=np.float32)
+        self.negotiation_demand = np.zeros(self._capacity, dtype=np.float32)
+        self.acceptance_threshold = np.zeros(self._capacity, dtype=np.float32)
+        self.greed_index = np.zeros(self._capacity, dtype=np.float32)
+
+        # Derived: desired intake per day, recomputed only when daily_need
+        # or request_multiplier change (mutation/imitation), read otherwise.
+        self.desired_intake = np.zeros(self._capacity, dtype=np.int32)
+
+        # Harvest history: per-agent ring buffer with running sum, so both
+        # the sliding-window trim and the average become O(1) updates.
+        self.harvest_buf = np.zeros((self._capacity, HARVEST_WINDOW), dtype=np.int32)
+        self.harvest_head = np.zeros(self._capacity, dtype=np.int32)
+        self.harvest_count = np.zeros(self._capacity, dtype=np.int32)
+        self.harvest_sum = np.zeros(self._capacity, dtype=np.int64)
+
+        # Cooperation history: same ring-buffer scheme over boolean outcomes;
+        # the running sum yields the cooperation rate without rewalking.
+        self.cooperation_buf = np.zeros(
+            (self._capacity, COOPERATION_WINDOW), dtype=np.uint8
+        )
+        self.cooperation_head = np.zeros(self._capacity, dtype=np.int32)
+        self.cooperation_count = np.zeros(self._capacity, dtype=np.int32)
+        self.cooperation_sum = np.zeros(self._capacity, dtype=np.int32)
+
+    _COLUMNS = (
+        "resources_reserve",
+        "daily_need",
+        "reproduction_reserve",
+        "reproduction_cost",
+        "age",
+        "position_x",
+        "position_y",
+        "alive",
+        "newborn",
+        "type_id",
+        "reputation",
+        "request_multiplier",
+        "negotiation_demand",
+        "acceptance_threshold",
+        "greed_index",
+        "desired_intake",
+        "harvest_buf",
+        "harvest_head",
+        "harvest_count",
+        "harvest_sum",
+        "cooperation_buf",
+        "cooperation_head",
+        "cooperation_count",
+        "cooperation_sum",
+    )
+
+    def __len__(self) -> int:
+        """Number of rows (agents ever added) in the pool."""
+        return self.size
+
+    def _grow(self, minimum: int) -> None:
+        """Grow all columns geometrically to hold at least `minimum` rows."""
+        new_capacity = self._capacity
+        while new_capacity < minimum:
+            new_capacity *= 2
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros((new_capacity,) + old.shape[1:], dtype=old.dtype)
+            new[: self.size] = old[: self.size]
+            setattr(self, name, new)
+        self._capacity = new_capacity
+
+    def add_agent(
+        self,
+        age: int = 0,
+        alive: bool = True,
+        reputation: float = 0.5,
+        resources_reserve: int = 0,
+        daily_need: int = 3,
+        reproduction_reserve: int = 8,
+        reproduction_cost: int = 8,
+        position_x: int = 0,
+        position_y: int = 0,
+        request_multiplier: float = 1.0,
+        negotiation_demand: float = 0.5,
+        acceptance_threshold: float = 0.3,
+        greed_index: float = 0.5,
+        type_id: int = -1,
+        newborn: bool = False,
+    ) -> int:
+        """
+        Append one agent row and return its index.
+
+        Defaults mirror the historical `AgentState` dataclass field defaults.
+        """
+        index = self.size
+        if index >= self._capacity:
+            self._grow(index + 1)
+        self.size = index + 1
+
+        self.age[index] = age
+        self.alive[index] = alive
+        self.reputation[index] = reputation
+        self.resources_reserve[index] = resources_reserve
+        self.daily_need[index] = daily_need
+        self.reproduction_reserve[index] = reproduction_reserve
+        self.reproduction_cost[index] = reproduction_cost
+        self.position_x[index] = position_x
+        self.position_y[index] = position_y
+        self.request_multiplier[index] = request_multiplier
+        self.negotiation_demand[index] = negotiation_demand
+        self.acceptance_threshold[index] = acceptance_threshold
+        self.greed_index[index] = greed_index
+        self.type_id[index] = type_id
+        self.newborn[index] = newborn
+        self.refresh_desired_intake(index)
+        return index
+
+    def add_agents_batch(self, n: int, **columns) -> np.ndarray:
+        """
+        Append `n` agent rows in one shot and return their indices.
+
+        Keyword arguments name pool columns and may be scalars or arrays
+        of length `n`; unmentioned columns take the same defaults as
+        `add_agent`. Filling whole column slices replaces n separate
+        Python-level row writes, so bulk construction (demo populations,
+        mass births) costs a handful of NumPy assignments.
+        """
+        start = self.size
+        end = start + n
+        if end > self._capacity:
+            self._grow(end)
+        self.size = end
+
+        values = dict(
+            age=0,
+            alive=True,
+            reputation=0.5,
+            resources_reserve=0,
+            daily_need=3,
+            reproduction_reserve=8,
+            reproduction_cost=8,
+            position_x=0,
+            position_y=0,
+            request_multiplier=1.0,
+            negotiation_demand=0.5,
+            acceptance_threshold=0.3,
+            greed_index=0.5,
+            type_id=-1,
+            newborn=False,
+        )
+        values.update(columns)
+        for name, value in values.items():
+            getattr(self, name)[start:end] = value
+        desired_intake_kernel(
+            self.daily_need[:end],
+            self.request_multiplier[:end],
+            self.desired_intake[:end],
+            end,
+        )
+        return np.arange(start, end, dtype=np.intp)
+
+    def type_mask(self, type_id: int) -> np.ndarray:
+        """Bool mask selecting all agents of one personality type."""
+        return self.type_id[: self.size] == type_id
+
+    def calculate_request_all(self, available: int) -> np.ndarray:
+        """
+        Per-day resource requests for the whole population.
+
+        Computed in per-type masked segments over the type_id column (the
+        vectorized replacement for per-agent virtual dispatch). The baseline
+        formula is shared by all current types — desired intake clamped to
+        what is available — so this is a single clip today; personality-
+        specific formulas slot in as additional masked writes.
+        """
+        n = self.size
+        return np.clip(self.desired_intake[:n], 0, max(available, 0))
+
+    def negotiate_demand_all(self, partner_reputation: np.ndarray) -> np.ndarray:
+        """
+        Negotiation demands for the whole population in one pass.
+
+        Each agent starts from its negotiation_demand column and shades the
+        demand by how reputable the partner is, scaled by its own greed:
+        greedy agents press low-reputation partners harder, while low-greed
+        agents concede toward fairness. Dispatches to the JIT-compiled
+        kernel when Numba is available.
+        """
+        n = self.size
+        partner_reputation = np.ascontiguousarray(partner_reputation, dtype=np.float32)
+        out = np.empty(n, dtype=np.float32)
+        negotiate_demand_kernel(
+            self.negotiation_demand, self.greed_index, partner_reputation, out, n
+        )
+        return out
+
+    def will_accept_offer_all(self, offers: np.ndarray) -> np.ndarray:
+        """
+        Bool mask of agents accepting the given offer fractions.
+
+        An offer is accepted outright when it meets the agent's acceptance
+        threshold, or probabilistically when it clears the per-type soft
+        threshold (see `_TYPE_SOFT_MULT`/`_TYPE_SOFT_PROB`); dead agents
+        never accept. The whole decision is one branchless masked
+        expression, with the uniform draws batched up front; dispatches to
+        the JIT-compiled kernel when Numba is available.
+        """
+        n = self.size
+        offers = np.ascontiguousarray(offers, dtype=np.float32)
+        tid = self.type_id[:n]
+        soft_threshold = self.acceptance_threshold[:n] * _TYPE_SOFT_MULT[tid]
+        soft_prob = _TYPE_SOFT_PROB[tid]
+        u = shared_rng().generator.random(n, dtype=np.float32)
+        out = np.empty(n, dtype=np.bool_)
+        accept_offer_kernel(
+            self.acceptance_threshold, soft_threshold, soft_prob, u,
+            self.alive, offers, out, n,
+        )
+        return out
+
+    def run_day_all(
+        self, partner_idx: np.ndarray, available: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Fused daily decision pass: requests, demands, and acceptances.
+
+        Computes, for every agent paired with `partner_idx[i]`, its
+        resource request (desired intake clamped to what is available),
+        its negotiation demand against the partner, and whether it accepts
+        the share the partner's demand leaves it — all in one kernel pass
+        so the trait columns stream through cache once instead of three
+        times. Acceptance uses the same hard/soft threshold rule as
+        `will_accept_offer_all`.
+
+        Returns:
+            (requests int32, demands float32, accepts bool) arrays.
+        """
+        n = self.size
+        partner_idx = np.ascontiguousarray(partner_idx, dtype=np.intp)
+        tid = self.type_id[:n]
+        soft_threshold = self.acceptance_threshold[:n] * _TYPE_SOFT_MULT[tid]
+        soft_prob = _TYPE_SOFT_PROB[tid]
+        u = shared_rng().generator.random(n, dtype=np.float32)
+        out_request = np.empty(n, dtype=np.int32)
+        out_demand = np.empty(n, dtype=np.float32)
+        out_accept = np.empty(n, dtype=np.bool_)
+        run_day_kernel(
+            self.desired_intake, self.negotiation_demand, self.greed_index,
+            self.acceptance_threshold, soft_threshold, soft_prob,
+            self.reputation, self.alive, partner_idx, u, max(available, 0),
+            out_request, out_demand, out_accept, n,
+        )
+        return out_request, out_demand, out_accept
+
+    def refresh_desired_intake(self, index: int | None = None) -> None:
+        """
+        Recompute the cached desired-intake column.
+
+        Args:
+            index: Row to refresh, or None to refresh the whole population
+                in one vectorized kernel pass.
+        """
+        if index is None:
+            desired_intake_kernel(
+                self.daily_need, self.request_multiplier, self.desired_intake, self.size
+            )
+            return
+        need = int(self.daily_need[index])
+        self.desired_intake[index] = max(
+            need, int(round(need * float(self.request_multiplier[index])))
+        )
+
+    def receive_resources(self, index: int, amount: int) -> None:
+        """Add collected resources to one agent's reserve."""
+        self.resources_reserve[index] += amount
+
+    def record_harvest(self, index: int, amount: int) -> None:
+        """O(1) append of one day's harvest into the agent's ring buffer."""
+        head = self.harvest_head[index]
+        evicted = self.harvest_buf[index, head]
+        self.harvest_buf[index, head] = amount
+        self.harvest_head[index] = (head + 1) % HARVEST_WINDOW
+        if self.harvest_count[index] < HARVEST_WINDOW:
+            self.harvest_count[index] += 1
+            self.harvest_sum[index] += amount
+        else:
+            self.harvest_sum[index] += amount - evicted
+
+    def receive_resources_all(self, amounts: np.ndarray) -> None:
+        """
+        Credit one day's harvest to every agent in vectorized passes.
+
+        The column add and the ring-buffer append each run as a handful
+        of whole-population array operations instead of N per-agent
+        calls; negative amounts clamp to zero-harvest entries exactly as
+        `BaseAgent.receive_resources` does, keeping histories day-aligned.
+        """
+        n = self.size
+        amounts = np.maximum(np.asarray(amounts[:n]), 0)
+        self.resources_reserve[:n] += amounts
+        rows = np.arange(n)
+        head = self.harvest_head[:n]
+        full = self.harvest_count[:n] == HARVEST_WINDOW
+        evicted = np.where(full, self.harvest_buf[rows, head], 0)
+        self.harvest_sum[:n] += amounts - evicted
+        self.harvest_buf[rows, head] = amounts
+        self.harvest_head[:n] = (head + 1) % HARVEST_WINDOW
+        np.minimum(self.harvest_count[:n] + 1, HARVEST_WINDOW,
+                   out=self.harvest_count[:n])
+
+    def set_positions_all(self, xs: np.ndarray, ys: np.ndarray) -> None:
+        """Write every agent's grid position with two column stores."""
+        n = self.size
+        self.position_x[:n] = xs[:n]
+        self.position_y[:n] = ys[:n]
+
+    def record_cooperation(self, index: int, success: bool) -> float:
+        """
+        O(1) append of one cooperation outcome; returns the updated rate.
+
+        Returns:
+            Fraction of successful cooperation events in the window.
+        """
+        head = self.cooperation_head[index]
+        evicted = self.cooperation_buf[index, head]
+        value = 1 if success else 0
+        self.cooperation_buf[index, head] = value
+        self.cooperation_head[index] = (head + 1) % COOPERATION_WINDOW
+        if self.cooperation_count[index] < COOPERATION_WINDOW:
+            self.cooperation_count[index] += 1
+            self.cooperation_sum[index] += value
+        else:
+            # Subtract in Python ints: value - evicted with a uint8 evicted
+            # would wrap to 255 under NumPy promotion when a success is
+            # evicted by a failure, corrupting the running sum.
+            self.cooperation_sum[index] += value - int(evicted)
+        return float(self.cooperation_sum[index]) / float(self.cooperation_count[index])
+
+    def upkeep_all(self) -> None:
+        """
+        Daily upkeep for the whole population in one vectorized pass.
+
+        Agents whose collected resources fall short of their daily need are
+        marked dead: `alive &= resources_reserve >= daily_need`. Runs via a
+        JIT-compiled kernel when Numba is available, vectorized NumPy
+        otherwise.
+        """
+        upkeep_kernel(self.alive, self.resources_reserve, self.daily_need, self.size)
+
+    def start_new_day_all(self) -> None:
+        """Reset per-day resource counters for the whole population."""
+        self.resources_reserve[: self.size].fill(0)
+
+    def can_reproduce_all(self) -> np.ndarray:
+        """Driver-facing alias for `can_reproduce_mask`."""
+        return self.can_reproduce_mask()
+
+    def desired_intake_all(self, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Desired intake for every agent, from the maintained cache column.
+
+        Args:
+            out: Optional int32 array of at least `size` entries to fill.
+
+        Returns:
+            Array of `max(daily_need, round(daily_need * request_multiplier))`
+            per agent.
+        """
+        n = self.size
+        if out is not None:
+            out[:n] = self.desired_intake[:n]
+            return out[:n]
+        return self.desired_intake[:n]
+
+    def to_records(self) -> np.ndarray:
+        """
+        Bulk-serialize the whole pool as a NumPy structured array.
+
+        One vectorized copy per column instead of one dict per agent;
+        intended for logging/metrics paths that snapshot every agent.
+        """
+        n = self.size
+        fields = (
+            "age",
+            "alive",
+            "reputation",
+            "resources_reserve",
+            "daily_need",
+            "request_multiplier",
+            "negotiation_demand",
+            "acceptance_threshold",
+            "greed_index",
+            "reproduction_reserve",
+            "reproduction_cost",
+            "position_x",
+            "position_y",
+        )
+        dtype = np.dtype(
+            [(name, getattr(self, name).dtype) for name in fields]
+        )
+        records = np.empty(n, dtype=dtype)
+        for name in fields:
+            records[name] = getattr(self, name)[:n]
+        return records
+
+    def can_reproduce_mask(self) -> np.ndarray:
+        """
+        Vectorized reproduction eligibility for the whole population.
+
+        Returns:
+            Bool array of shape (size,): `alive & (reserve >= repro_reserve)`.
+        """
+        n = self.size
+        return self.alive[:n] & (
+            self.resources_reserve[:n] >= self.reproduction_reserve[:n]
+        )
+
+
+# Shared pool used by agents that are not given an explicit pool. Keeping a
+# single process-wide default means ad-hoc agent construction (tests, scripts)
+# still lands in one contiguous columnar store.
+_default_pool: AgentPool | None = None
+
+
+def default_pool() -> AgentPool:
+    """Return the process-wide default `AgentPool`, creating it on first use."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = AgentPool()
+    return _default_pool
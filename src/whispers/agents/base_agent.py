@@ -2,122 +2,341 @@
 Base agent class for the Whispers of Self simulation.
 
 This module defines the core agent interface and common functionality
-that all agent types will inherit from.
+that all agent types will inherit from. Numeric per-agent state lives in
+an `AgentPool` (Structure-of-Arrays); `AgentState` and `BaseAgent` are
+thin index-based views onto one pool row.
 """
 
-from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-import uuid
+from abc import ABC
+from itertools import count
+from typing import ClassVar, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .agent_pool import (
+    AGENT_TYPE_IDS,
+    HARVEST_WINDOW,
+    AgentPool,
+    HistoryView,
+    default_pool,
+)
+from ..rng import shared_rng
+
+# Process-wide monotonic agent id source. Simulations only need local
+# uniqueness, so a counter replaces the old per-agent uuid4() call; the
+# string form is formatted lazily on first access.
+_next_id = count()
 
 
-@dataclass
 class AgentState:
-    """Represents the current state of an agent."""
-    id: str
-    agent_type: str
-    age: int = 0
-    alive: bool = True
-    reputation: float = 0.5
-    harvest_history: List[int] = field(default_factory=list)
-    cooperation_history: List[bool] = field(default_factory=list)
-    
-    # Survival and reproduction economy
-    resources_reserve: int = 0
-    daily_need: int = 3
-    reproduction_reserve: int = 8
-    reproduction_cost: int = 8
-
-    # Spatial exploration (discrete grid coordinates)
-    position_x: int = 0
-    position_y: int = 0
-    
-    # Strategy parameters
-    request_multiplier: float = 1.0
-    negotiation_demand: float = 0.5
-    acceptance_threshold: float = 0.3
-    greed_index: float = 0.5
-    
-    # Reproduction tracking
-    newborn: bool = False
+    """
+    View of one agent's state, backed by a row in an `AgentPool`.
+
+    Numeric fields (resources, needs, position, reputation, strategy
+    parameters, liveness) are stored in the pool's columnar arrays;
+    attribute access reads and writes the agent's row. Non-numeric fields
+    (identity, histories) remain ordinary Python attributes.
+    """
+
+    # Fixed slots: no per-instance __dict__, attribute loads become
+    # fixed-offset accesses. `id` stays unset until lazily formatted.
+    __slots__ = (
+        "pool",
+        "index",
+        "id_num",
+        "id",
+        "agent_type",
+        "harvest_history",
+        "cooperation_history",
+    )
+
+    _POOL_FIELDS = frozenset(
+        {
+            "age",
+            "alive",
+            "newborn",
+            "reputation",
+            "resources_reserve",
+            "daily_need",
+            "reproduction_reserve",
+            "reproduction_cost",
+            "position_x",
+            "position_y",
+            "request_multiplier",
+            "negotiation_demand",
+            "acceptance_threshold",
+            "greed_index",
+        }
+    )
+    _INT_FIELDS = frozenset(
+        {
+            "age",
+            "resources_reserve",
+            "daily_need",
+            "reproduction_reserve",
+            "reproduction_cost",
+            "position_x",
+            "position_y",
+        }
+    )
+
+    def __init__(
+        self,
+        agent_type: str,
+        id: Optional[str] = None,
+        pool: Optional[AgentPool] = None,
+        harvest_history: Optional[List[int]] = None,
+        cooperation_history: Optional[List[bool]] = None,
+        newborn: bool = False,
+        **kwargs,
+    ):
+        """Allocate a pool row and initialize it from the given fields."""
+        object.__setattr__(self, "pool", pool if pool is not None else default_pool())
+        # Plain membership test instead of setdefault: skips both the
+        # default-value computation and the dict machinery when the caller
+        # already supplied a type id.
+        if "type_id" not in kwargs:
+            kwargs["type_id"] = AGENT_TYPE_IDS.get(agent_type, -1)
+        kwargs["newborn"] = newborn
+        object.__setattr__(self, "index", self.pool.add_agent(**kwargs))
+        object.__setattr__(self, "id_num", next(_next_id))
+        if id is not None:
+            object.__setattr__(self, "id", id)
+        object.__setattr__(self, "agent_type", agent_type)
+        object.__setattr__(
+            self, "harvest_history", HistoryView(self.pool, self.index, "harvest", int)
+        )
+        object.__setattr__(
+            self,
+            "cooperation_history",
+            HistoryView(self.pool, self.index, "cooperation", bool),
+        )
+        # Seed ring buffers when explicit histories are provided.
+        for amount in harvest_history or ():
+            self.pool.record_harvest(self.index, amount)
+        for outcome in cooperation_history or ():
+            self.pool.record_cooperation(self.index, outcome)
+
+    @classmethod
+    def from_row(cls, pool: AgentPool, index: int, agent_type: str) -> "AgentState":
+        """Wrap an already-filled pool row in a view, skipping row allocation."""
+        self = object.__new__(cls)
+        object.__setattr__(self, "pool", pool)
+        object.__setattr__(self, "index", index)
+        object.__setattr__(self, "id_num", next(_next_id))
+        object.__setattr__(self, "agent_type", agent_type)
+        object.__setattr__(
+            self, "harvest_history", HistoryView(pool, index, "harvest", int)
+        )
+        object.__setattr__(
+            self, "cooperation_history", HistoryView(pool, index, "cooperation", bool)
+        )
+        return self
+
+    def __getattr__(self, name):
+        if name == "id":
+            # Lazily format (and cache) the string id on first access; the
+            # hot path only ever touches the integer `id_num`.
+            ident = f"{self.id_num:08x}"
+            object.__setattr__(self, "id", ident)
+            return ident
+        if name in self._POOL_FIELDS:
+            value = getattr(self.pool, name)[self.index]
+            if name == "alive" or name == "newborn":
+                return bool(value)
+            if name in self._INT_FIELDS:
+                return int(value)
+            return float(value)
+        raise AttributeError(
+            f"{self.__class__.__name__!r} object has no attribute {name!r}"
+        )
+
+    def __setattr__(self, name, value):
+        if name in self._POOL_FIELDS:
+            getattr(self.pool, name)[self.index] = value
+            # Keep the cached desired-intake column in sync with its inputs.
+            if name == "daily_need" or name == "request_multiplier":
+                self.pool.refresh_desired_intake(self.index)
+        else:
+            object.__setattr__(self, name, value)
 
 
 class BaseAgent(ABC):
     """
     Abstract base class for all agents in the simulation.
-    
+
     This class defines the interface and common functionality that all
     agent types must implement.
     """
-    
-    def __init__(self, agent_type: str, **kwargs):
-        """Initialize a new agent."""
+
+    # `pool` and `index` are stored directly on the agent so the hot-path
+    # methods reach the columnar state in a single load, without going
+    # through the `state` view first.
+    __slots__ = ("state", "pool", "index")
+
+    # Mutation alternates indexed by type_id (row order matches
+    # AGENT_TYPE_IDS), populated once by the personalities package after
+    # its classes are defined. Keeping the table on the base class lets
+    # one shared reproduce implementation serve every personality, and the
+    # int index replaces a string-keyed dict lookup on the hot path.
+    _MUTATION_TABLE: ClassVar[List[Tuple[type, type]]] = []
+
+    # Late-bound registry of concrete personality classes by type name,
+    # also populated by the personalities package; breaks the circular
+    # import without per-call module lookups.
+    _TYPE_REGISTRY: ClassVar[Dict[str, type]] = {}
+
+    # Per-type constants each personality overrides: its type name and its
+    # strategy defaults in (request_multiplier, negotiation_demand,
+    # acceptance_threshold, greed_index) order. Resolving defaults from a
+    # class tuple keeps construction free of per-call dict merges — births
+    # during reproduction are the hottest allocation path in the simulation.
+    _TYPE: ClassVar[str] = "unknown"
+    _DEFAULTS: ClassVar[Tuple[float, float, float, float]] = (1.0, 0.5, 0.3, 0.5)
+
+    # type_id-indexed float32 table of the personality `_DEFAULTS` rows,
+    # installed by the personalities package; lets batch construction
+    # gather whole trait columns instead of consulting classes per agent.
+    _TYPE_DEFAULT_TABLE: ClassVar[Optional[np.ndarray]] = None
+
+    def __init__(
+        self,
+        agent_type: Optional[str] = None,
+        request_multiplier: Optional[float] = None,
+        negotiation_demand: Optional[float] = None,
+        acceptance_threshold: Optional[float] = None,
+        greed_index: Optional[float] = None,
+        **kwargs,
+    ):
+        """Initialize a new agent, filling strategy params from `_DEFAULTS`."""
+        d = self._DEFAULTS
         self.state = AgentState(
-            id=str(uuid.uuid4()),
-            agent_type=agent_type,
-            **kwargs
+            agent_type=self._TYPE if agent_type is None else agent_type,
+            request_multiplier=d[0] if request_multiplier is None else request_multiplier,
+            negotiation_demand=d[1] if negotiation_demand is None else negotiation_demand,
+            acceptance_threshold=d[2] if acceptance_threshold is None else acceptance_threshold,
+            greed_index=d[3] if greed_index is None else greed_index,
+            **kwargs,
         )
-        
+        self.pool = self.state.pool
+        self.index = self.state.index
+
+    @classmethod
+    def from_columns(
+        cls,
+        agent_types,
+        ages,
+        resources,
+        pool: Optional[AgentPool] = None,
+    ) -> List["BaseAgent"]:
+        """
+        Batch-construct agents from parallel columns.
+
+        All pool rows are filled with a handful of vectorized slice writes
+        (see `AgentPool.add_agents_batch`) and each returned agent is a
+        thin view onto its row, so building a demo population of hundreds
+        of agents costs a few NumPy assignments instead of per-agent
+        constructions and attribute churn. Type names resolve through the
+        personality registry; unknown names fall back to `cls`.
+        """
+        pool = pool if pool is not None else default_pool()
+        agent_types = list(agent_types)
+        type_ids = np.fromiter(
+            (AGENT_TYPE_IDS.get(name, -1) for name in agent_types),
+            np.int8,
+            len(agent_types),
+        )
+        traits = {}
+        table = cls._TYPE_DEFAULT_TABLE
+        if table is not None:
+            # One gather per trait column from the per-type defaults
+            # table; unknown type ids fall back to the base defaults.
+            rows = table[np.clip(type_ids, 0, len(table) - 1)]
+            unknown = type_ids < 0
+            if unknown.any():
+                rows[unknown] = np.asarray(cls._DEFAULTS, dtype=np.float32)
+            traits = {
+                "request_multiplier": rows[:, 0],
+                "negotiation_demand": rows[:, 1],
+                "acceptance_threshold": rows[:, 2],
+                "greed_index": rows[:, 3],
+            }
+        indices = pool.add_agents_batch(
+            len(agent_types),
+            age=np.asarray(ages),
+            resources_reserve=np.asarray(resources),
+            type_id=type_ids,
+            **traits,
+        )
+        registry = cls._TYPE_REGISTRY
+        agents: List[BaseAgent] = []
+        for name, index in zip(agent_types, indices):
+            agent = object.__new__(registry.get(name, cls))
+            agent.state = AgentState.from_row(pool, int(index), name)
+            agent.pool = pool
+            agent.index = int(index)
+            agents.append(agent)
+        return agents
+
     @property
     def id(self) -> str:
         """Get the agent's unique identifier."""
         return self.state.id
-    
+
     @property
     def agent_type(self) -> str:
         """Get the agent's type."""
         return self.state.agent_type
-    
+
     @property
     def age(self) -> int:
         """Get the agent's age."""
-        return self.state.age
-    
+        return int(self.pool.age[self.index])
+
     @property
     def alive(self) -> bool:
         """Check if the agent is alive."""
-        return self.state.alive
-    
+        return bool(self.pool.alive[self.index])
+
     @property
     def reputation(self) -> float:
         """Get the agent's reputation score."""
-        return self.state.reputation
-    
+        return float(self.pool.reputation[self.index])
+
     def die(self) -> None:
         """Mark the agent as dead."""
-        self.state.alive = False
-    
+        self.pool.alive[self.index] = False
+
     def age_step(self) -> None:
         """Increment the agent's age by one day."""
-        self.state.age += 1
-    
+        self.pool.age[self.index] += 1
+
     def receive_resources(self, amount: int) -> None:
-        """Receive resources (from environment/negotiation) and log harvest history."""
-        if amount <= 0:
-            # Still record zero for history consistency
-            self.state.harvest_history.append(0)
-        else:
-            self.state.resources_reserve += amount
-            self.state.harvest_history.append(amount)
-            
+        """Receive resources (from environment/negotiation) and log harvest history.
+
+        Non-positive amounts are clamped to a zero-harvest entry, so the
+        history stays day-aligned without a separate append path.
+        """
+        amount = amount if amount > 0 else 0
+        pool, i = self.pool, self.index
+        pool.resources_reserve[i] += amount
+        pool.record_harvest(i, amount)
+
     def add_resources(self, amount: int) -> None:
         """Backward-compatible alias to receive resources into reserve."""
         self.receive_resources(amount)
 
-        
-        # Keep only last 10 harvests for memory
-        if len(self.state.harvest_history) > 10:
-            self.state.harvest_history.pop(0)
-    
     def consume_resources(self, amount: int) -> bool:
         """Consume resources from reserve; return True if fully satisfied."""
         if amount <= 0:
             return True
-        if self.state.resources_reserve >= amount:
-            self.state.resources_reserve -= amount
+        reserve = self.pool.resources_reserve
+        i = self.index
+        if reserve[i] >= amount:
+            reserve[i] -= amount
             return True
         # Not enough to cover amount
-        self.state.resources_reserve = 0
+        reserve[i] = 0
         return False
 
     def perform_daily_upkeep(self) -> None:
@@ -127,92 +346,130 @@ class BaseAgent(ABC):
         the agent has collected at least `daily_need` today. Any surplus does not
         roll over and should be reset by `start_new_day`.
         """
-        if self.state.resources_reserve < self.state.daily_need:
+        if self.pool.resources_reserve[self.index] < self.pool.daily_need[self.index]:
             self.die()
-    
+
     def update_reputation(self, cooperation_success: bool) -> None:
         """
         Update the agent's reputation based on cooperation behavior.
-        
+
         Args:
             cooperation_success: Whether the agent successfully cooperated
         """
-        self.state.cooperation_history.append(cooperation_success)
-        
-        # Keep only last 20 cooperation events
-        if len(self.state.cooperation_history) > 20:
-            self.state.cooperation_history.pop(0)
-        
-        # Calculate reputation as moving average of cooperation
-        if self.state.cooperation_history:
-            cooperation_rate = sum(self.state.cooperation_history) / len(self.state.cooperation_history)
-            # Smooth update with learning rate
-            self.state.reputation = 0.9 * self.state.reputation + 0.1 * cooperation_rate
-    
+        # Ring buffer keeps only the last 20 cooperation events and returns
+        # the cooperation rate from its running sum (no list rewalk).
+        pool, i = self.pool, self.index
+        cooperation_rate = pool.record_cooperation(i, cooperation_success)
+        # Smooth update with learning rate: one branchless EWMA expression,
+        # no clamp needed since both operands stay in [0, 1].
+        pool.reputation[i] = 0.9 * pool.reputation[i] + 0.1 * cooperation_rate
+
     def get_average_harvest(self, days: int = 5) -> float:
         """
         Get the average harvest over the last N days.
-        
+
         Args:
             days: Number of recent days to average over
-            
+
         Returns:
             Average harvest over the specified period
         """
-        recent_harvests = self.state.harvest_history[-days:] if self.state.harvest_history else [0]
-        return sum(recent_harvests) / len(recent_harvests)
-        
+        pool, i = self.pool, self.index
+        count = int(pool.harvest_count[i])
+        if count == 0:
+            return 0.0
+        if days <= 0 or days >= count:
+            # Whole window requested: use the maintained running sum, O(1).
+            # days <= 0 falls through here too, matching the historical
+            # `harvest_history[-0:]` slice (full-window average).
+            return int(pool.harvest_sum[i]) / count
+        # Partial window: sum the newest `days` ring-buffer slots directly,
+        # without materializing a Python list.
+        buf = pool.harvest_buf[i]
+        head = int(pool.harvest_head[i])
+        if count < HARVEST_WINDOW:
+            total = int(buf[count - days:count].sum())
+        elif head >= days:
+            total = int(buf[head - days:head].sum())
+        else:
+            total = int(buf[head - days:].sum()) + int(buf[:head].sum())
+        return total / days
+
     def reproduce(self, mutation_rate: float = 0.05) -> Optional['BaseAgent']:
         """
         Create an offspring agent with potential mutations.
-        
+
+        Shared, data-driven implementation for every personality: a mutation
+        picks one of the two alternate types from the type-id-indexed
+        `_MUTATION_TABLE`, otherwise the offspring is a same-type clone with
+        perturbed strategy parameters.
+
         Args:
             mutation_rate: Probability of mutation in offspring
-            
+
         Returns:
             New agent instance or None if reproduction fails
         """
-        # Gate reproduction on today's collected resources; subclasses should call this method first
+        # Gate reproduction on today's collected resources
         if not self.can_reproduce():
             return None
-        # Subclasses create the actual offspring; after success, charge cost
-        return None
+        rng = shared_rng()
+        tid = int(self.pool.type_id[self.index])
+        if 0 <= tid < len(self._MUTATION_TABLE) and rng.random() < mutation_rate:
+            offspring = self._MUTATION_TABLE[tid][int(rng.random() >= 0.5)]()
+        else:
+            pool, i = self.pool, self.index
+            offspring = type(self)(
+                request_multiplier=float(pool.request_multiplier[i]) + rng.uniform(-0.1, 0.1),
+                negotiation_demand=float(pool.negotiation_demand[i]) + rng.uniform(-0.05, 0.05),
+                acceptance_threshold=float(pool.acceptance_threshold[i]) + rng.uniform(-0.05, 0.05),
+                greed_index=float(pool.greed_index[i]) + rng.uniform(-0.1, 0.1),
+            )
+        self.charge_reproduction_cost()
+        return offspring
 
     def can_reproduce(self) -> bool:
         """Check whether the agent has enough collected today to reproduce."""
-        return self.state.alive and self.state.resources_reserve >= self.state.reproduction_reserve
+        pool, i = self.pool, self.index
+        return bool(pool.alive[i]) and bool(
+            pool.resources_reserve[i] >= pool.reproduction_reserve[i]
+        )
 
     def charge_reproduction_cost(self) -> None:
         """Deduct reproduction cost from today's collected resources after reproduction."""
-        self.consume_resources(self.state.reproduction_cost)
+        self.consume_resources(int(self.pool.reproduction_cost[self.index]))
 
     def start_new_day(self) -> None:
         """Reset per-day resource counters (no reserves carried over)."""
-        self.state.resources_reserve = 0
-    
+        self.pool.resources_reserve[self.index] = 0
+
     def to_dict(self) -> Dict:
         """Convert agent state to dictionary for serialization."""
+        # One const-key dict literal: CPython emits a single
+        # BUILD_CONST_KEY_MAP, sized exactly, with no per-key inserts.
+        pool, i = self.pool, self.index
+        reserve = int(pool.resources_reserve[i])
         return {
             'id': self.state.id,
             'agent_type': self.state.agent_type,
-            'age': self.state.age,
-            'alive': self.state.alive,
-            'reputation': self.state.reputation,
-            'resources_reserve': self.state.resources_reserve,
-            'resource_reserve': self.state.resources_reserve,  # alias for compatibility
-            'daily_need': self.state.daily_need,
-            'request_multiplier': self.state.request_multiplier,
-            'negotiation_demand': self.state.negotiation_demand,
-            'acceptance_threshold': self.state.acceptance_threshold,
-            'greed_index': self.state.greed_index,
-            'reproduction_reserve': self.state.reproduction_reserve,
-            'reproduction_cost': self.state.reproduction_cost,
+            'age': int(pool.age[i]),
+            'alive': bool(pool.alive[i]),
+            'reputation': float(pool.reputation[i]),
+            'resources_reserve': reserve,
+            'resource_reserve': reserve,  # alias for compatibility
+            'daily_need': int(pool.daily_need[i]),
+            'request_multiplier': float(pool.request_multiplier[i]),
+            'negotiation_demand': float(pool.negotiation_demand[i]),
+            'acceptance_threshold': float(pool.acceptance_threshold[i]),
+            'greed_index': float(pool.greed_index[i]),
+            'reproduction_reserve': int(pool.reproduction_reserve[i]),
+            'reproduction_cost': int(pool.reproduction_cost[i]),
         }
-    
+
     def __str__(self) -> str:
         """String representation of the agent."""
         return f"{self.agent_type}(id={self.id[:8]}, age={self.age}, alive={self.alive})"
-    
+
     def __repr__(self) -> str:
         """Detailed string representation of the agent."""
         return (f"{self.__class__.__name__}(id={self.id[:8]}, type={self.agent_type}, "
@@ -221,13 +478,15 @@ class BaseAgent(ABC):
     # --- Exploration and goals ---
     def set_position(self, x: int, y: int) -> None:
         """Set the agent's grid position."""
-        self.state.position_x = x
-        self.state.position_y = y
+        self.pool.position_x[self.index] = x
+        self.pool.position_y[self.index] = y
 
     def get_position(self) -> tuple[int, int]:
         """Get the agent's grid position."""
-        return (self.state.position_x, self.state.position_y)
+        return (int(self.pool.position_x[self.index]), int(self.pool.position_y[self.index]))
 
     def desired_intake_today(self) -> int:
         """How much the agent strives to collect today based on traits."""
-        return max(self.state.daily_need, int(round(self.state.daily_need * self.state.request_multiplier)))
\ No newline at end of file
+        # Precomputed in the pool; refreshed when daily_need or
+        # request_multiplier change.
+        return int(self.pool.desired_intake[self.index])
@@ -4,8 +4,41 @@ Personality agent implementations.
 This package contains the concrete personality types that inherit from BaseAgent.
 """
 
+import numpy as np
+
 from .altruist import Altruist
 from .egoist import Egoist
 from .pragmatist import Pragmatist
 
+from ..base_agent import BaseAgent
+
+# Register the mutation alternates table driving the shared
+# BaseAgent.reproduce implementation. Rows are ordered by type_id
+# (altruist, egoist, pragmatist) and each pair preserves the historical
+# 50/50 split per type.
+BaseAgent._TYPE_REGISTRY.update(
+    {
+        "altruist": Altruist,
+        "egoist": Egoist,
+        "pragmatist": Pragmatist,
+    }
+)
+if not BaseAgent._MUTATION_TABLE:
+    BaseAgent._MUTATION_TABLE.extend(
+        [
+            (Pragmatist, Egoist),
+            (Pragmatist, Altruist),
+            (Altruist, Egoist),
+        ]
+    )
+
+# Strategy defaults as one type_id-indexed float32 table (same row order),
+# so batch construction fills whole trait columns with a single gather
+# instead of reading per-class tuples agent by agent.
+if BaseAgent._TYPE_DEFAULT_TABLE is None:
+    BaseAgent._TYPE_DEFAULT_TABLE = np.array(
+        [Altruist._DEFAULTS, Egoist._DEFAULTS, Pragmatist._DEFAULTS],
+        dtype=np.float32,
+    )
+
 __all__ = ["Altruist", "Egoist", "Pragmatist"]
@@ -2,8 +2,6 @@
 Re-export personality agents from their split modules for backward compatibility.
 """
 
-from .personalities.altruist import Altruist
-from .personalities.egoist import Egoist
-from .personalities.pragmatist import Pragmatist
+from .personalities import Altruist, Egoist, Pragmatist
 
 __all__ = ["Altruist", "Egoist", "Pragmatist"]
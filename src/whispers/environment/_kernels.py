@@ -0,0 +1,58 @@
+"""
+Hot spatial kernels over the environment's resource position columns.
+
+Same optional-Numba arrangement as `whispers.agents._kernels`: with
+Numba installed the scan is a JIT-compiled tight loop (`cache=True`, so
+the compile cost is paid once per machine), and without it the same
+entry point falls back to a vectorized NumPy expression with identical
+results, lowest index winning ties in both cases.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+if os.environ.get("WHISPERS_DISABLE_JIT"):  # debugging escape hatch
+    njit = None
+    HAVE_NUMBA = False
+else:
+    try:
+        from numba import njit
+
+        HAVE_NUMBA = True
+    except ImportError:  # pragma: no cover - exercised only without numba
+        njit = None
+        HAVE_NUMBA = False
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+def _closest_manhattan_loop(xs, ys, collected, px, py, n):
+    best = -1
+    best_distance = _INT32_MAX
+    for i in range(n):
+        if collected[i]:
+            continue
+        distance = abs(xs[i] - px) + abs(ys[i] - py)
+        if distance < best_distance:
+            best_distance = distance
+            best = i
+            if distance == 0:
+                # Nothing can beat a resource under the agent's feet.
+                break
+    return best
+
+
+def _closest_manhattan_numpy(xs, ys, collected, px, py, n):
+    distances = np.abs(xs[:n] - px) + np.abs(ys[:n] - py)
+    distances[collected[:n]] = _INT32_MAX
+    index = int(distances.argmin())
+    return -1 if collected[index] else index
+
+
+if HAVE_NUMBA:
+    closest_manhattan_kernel = njit(cache=True)(_closest_manhattan_loop)
+else:
+    closest_manhattan_kernel = _closest_manhattan_numpy
@@ -5,16 +5,32 @@ This module provides the spatial environment where agents interact,
 resources spawn, and agents navigate to find resources.
 """
 
-import random
+import io
+import logging
+import sys
 from dataclasses import dataclass
 from typing import List, Tuple, Optional, Dict
+
+import numpy as np
+
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 
+from ..rng import shared_rng
+from ._kernels import closest_manhattan_kernel
+
+logger = logging.getLogger(__name__)
+
+# Render symbols indexed by [type_id, newborn]; row order matches the
+# agent pool's type ids (altruist, egoist, pragmatist). Unknown types
+# share the altruist row, as the old per-string branching did.
+_SYMBOL_TABLE = np.array([['A', 'a'], ['E', 'e'], ['P', 'p']], dtype='<U1')
+_TYPE_ROWS = {'altruist': 0, 'egoist': 1, 'pragmatist': 2}
+
 
-@dataclass
+@dataclass(slots=True)
 class Resource:
     """Represents a resource in the environment."""
     x: int
@@ -29,49 +45,164 @@ class Resource:
 class Environment:
     """
     Spatial environment where agents navigate and collect resources.
-    
+
     The environment is a discrete grid where:
     - Resources spawn randomly each day
     - Agents can move to adjacent cells
     - Agents can see all resources and navigate to the closest one
     """
+
+    # Spatial bucket edge length, and the resource count above which the
+    # bucketed nearest-neighbour search replaces the linear distance scan.
+    # Ring expansion already wins comfortably at a few dozen resources;
+    # below that the two-ufunc scan is cheaper than building the index.
+    _BUCKET_SIZE = 8
+    _BUCKET_MIN_RESOURCES = 64
     
-    def __init__(self, width: int = 20, height: int = 20, resource_spawn_rate: float = 25.0):
+    def __init__(self, width: int = 20, height: int = 20, resource_spawn_rate: float = 25.0,
+                 verbosity: int = 0, display_stride: int = 10):
         """
         Initialize the environment.
-        
+
         Args:
             width: Width of the environment grid
             height: Height of the environment grid
             resource_spawn_rate: Average number of resources to spawn per day (Poisson)
+            verbosity: 0 silences display/get_display_string (the default);
+                higher values render them
+            display_stride: Buffered frames accumulated by `render_frame`
+                before one batched flush to stdout
         """
         self.width = width
         self.height = height
         self.resource_spawn_rate = resource_spawn_rate
+        self.verbosity = verbosity
+        self.display_stride = display_stride
+        # Reusable text buffer for the plain-text frame path; frames are
+        # batched here and flushed every `display_stride` renders.
+        self._frame_buf = io.StringIO()
+        self._frames_buffered = 0
         self.resources: List[Resource] = []
-        self.console = Console()
+        # Running count of collections made through collect_resource; keeps
+        # the counter helpers O(1) instead of rescanning the list.
+        self._n_collected = 0
+        # Rich Console and the grid frame buffer are allocation-heavy, so
+        # both are created lazily on first render and reused after.
+        self._console: Optional[Console] = None
+        self._grid_buf: Optional[np.ndarray] = None
+        # PCG64 generator shared with the rest of the process; spawn draws
+        # are batched through it instead of per-call stdlib random.
+        self._rng = shared_rng().generator
+        # Position cache for the vectorized closest-resource scan. Resource
+        # positions never change after spawn, so the x/y columns are rebuilt
+        # only when the resources list itself is replaced (or resized);
+        # `collected` flags can be flipped directly on the dataclass, so
+        # they are gathered fresh per query.
+        self._rx = np.empty(0, dtype=np.int32)
+        self._ry = np.empty(0, dtype=np.int32)
+        self._cached_resources: Optional[List[Resource]] = None
+        # Coarse spatial buckets for large resource fields: resource indices
+        # keyed by (x // _BUCKET_SIZE, y // _BUCKET_SIZE), built lazily and
+        # only consulted above _BUCKET_MIN_RESOURCES, where ring expansion
+        # beats the full-array distance scan.
+        self._buckets: Optional[Dict[Tuple[int, int], List[int]]] = None
+        # Occupied-bucket bounding box (min bx, max bx, min by, max by),
+        # set alongside `_buckets`; caps the ring expansion exactly.
+        self._bucket_bounds: Tuple[int, int, int, int] = (0, 0, 0, 0)
+        # Memo for repeated closest-resource queries from the same point
+        # (agents camp on hot spots). A hit is served only while the
+        # cached resource is still uncollected — collection is monotone,
+        # so nothing can become closer without the resources list itself
+        # changing, which invalidates the whole cache.
+        self._query_cache: Dict[Tuple[int, int], Resource] = {}
         
+    @property
+    def console(self) -> Console:
+        """Rich console, created on first use and cached."""
+        if self._console is None:
+            self._console = Console()
+        return self._console
+
+    def _reset_grid(self) -> np.ndarray:
+        """Return the reusable render buffer, cleared to blanks."""
+        if self._grid_buf is None:
+            self._grid_buf = np.full((self.height, self.width), ' ', dtype='<U1')
+        else:
+            self._grid_buf.fill(' ')
+        return self._grid_buf
+
+    def _render_grid(self, agent_positions: Dict[str, Tuple[int, int]],
+                     agent_types: Dict[str, str],
+                     agent_info: Dict[str, dict]) -> np.ndarray:
+        """Fill the reused frame buffer with resources and agent symbols."""
+        grid = self._reset_grid()
+
+        # Place resources
+        for resource in self.resources:
+            if not resource.collected:
+                grid[resource.y][resource.x] = f'{resource.value}'
+
+        if agent_positions:
+            # Gather the per-agent dicts into parallel arrays once, then
+            # place every symbol with one fancy-index write instead of
+            # per-agent hash lookups and string branching.
+            n = len(agent_positions)
+            xs = np.empty(n, dtype=np.int32)
+            ys = np.empty(n, dtype=np.int32)
+            rows = np.empty(n, dtype=np.int8)
+            newborn = np.empty(n, dtype=np.intp)
+            for i, (agent_id, (x, y)) in enumerate(agent_positions.items()):
+                xs[i] = x
+                ys[i] = y
+                rows[i] = _TYPE_ROWS.get(agent_types.get(agent_id), 0)
+                newborn[i] = 1 if agent_info.get(agent_id, {}).get('newborn') else 0
+            self._place_agent_symbols(grid, xs, ys, rows, newborn)
+        return grid
+
+    def _place_agent_symbols(self, grid: np.ndarray, xs: np.ndarray,
+                             ys: np.ndarray, rows: np.ndarray,
+                             newborn: np.ndarray) -> None:
+        """Write agent symbols into the frame buffer in one masked pass."""
+        in_bounds = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        xs, ys = xs[in_bounds], ys[in_bounds]
+        grid[ys, xs] = _SYMBOL_TABLE[rows[in_bounds], newborn[in_bounds]]
+
     def spawn_resources(self) -> None:
         """Spawn new resources randomly across the environment."""
-        # Clear old resources
-        self.resources = []
-        
-        # Calculate target number of resources based on spawn rate
-        target_resources = int(self.resource_spawn_rate * self.width * self.height)
-        
+        # Daily count is Poisson-distributed around the configured mean
+        # (rate per cell times grid area), as the constructor docstring
+        # always promised. Degenerate grids and a zero rate spawn nothing.
+        mean = self.resource_spawn_rate * self.width * self.height
+        if mean <= 0 or self.width <= 0 or self.height <= 0:
+            self.resources = []
+            self._n_collected = 0
+            return
+
         # Ensure minimum viable resources for survival
-        min_resources = max(5, target_resources)  # At least 5 resources for basic survival
-        
-        # Spawn resources at random positions
-        for _ in range(min_resources):
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-            value = 1  # All resources are worth 1
-            self.resources.append(Resource(x, y, value))
-        
-        # Debug logging
-        if hasattr(self, 'console'):
-            self.console.print(f"[dim]Spawned {min_resources} resources (target: {target_resources}, rate: {self.resource_spawn_rate:.3f})[/dim]")
+        n = max(5, int(self._rng.poisson(mean)))
+
+        # Both coordinate vectors come from one batched Generator call
+        # each rather than 2*N scalar draws; tolist() converts to plain
+        # ints in one C pass, so the comprehension never boxes np scalars.
+        xs = self._rng.integers(0, self.width, size=n, dtype=np.int32)
+        ys = self._rng.integers(0, self.height, size=n, dtype=np.int32)
+        self.resources = [Resource(x, y, 1) for x, y in zip(xs.tolist(), ys.tolist())]
+        # The draws ARE the SoA position columns: seed the query cache
+        # directly so the first closest-resource call never walks the
+        # freshly built objects attribute-by-attribute.
+        self._rx = xs
+        self._ry = ys
+        self._cached_resources = self.resources
+        self._buckets = None
+        self._query_cache.clear()
+        self._n_collected = 0
+
+        # Debug logging (stdlib logging: no Rich formatting cost unless a
+        # handler actually wants DEBUG records)
+        logger.debug(
+            "Spawned %d resources (mean: %.1f, rate: %.3f)",
+            n, mean, self.resource_spawn_rate,
+        )
     
     def get_closest_resource(self, agent_x: int, agent_y: int) -> Optional[Resource]:
         """
@@ -84,15 +215,102 @@ class Environment:
         Returns:
             Closest uncollected resource or None if no resources available
         """
-        available_resources = [r for r in self.resources if not r.collected]
-        
-        if not available_resources:
+        resources = self.resources
+        n = len(resources)
+        if n == 0:
             return None
-        
-        # Find closest resource using Manhattan distance
-        closest = min(available_resources, 
-                     key=lambda r: abs(r.x - agent_x) + abs(r.y - agent_y))
-        return closest
+
+        if self._cached_resources is not resources or len(self._rx) != n:
+            self._rx = np.fromiter((r.x for r in resources), np.int32, n)
+            self._ry = np.fromiter((r.y for r in resources), np.int32, n)
+            self._cached_resources = resources
+            self._buckets = None
+            self._query_cache.clear()
+
+        hit = self._query_cache.get((agent_x, agent_y))
+        if hit is not None and not hit.collected:
+            return hit
+
+        if n >= self._BUCKET_MIN_RESOURCES:
+            return self._memoize(agent_x, agent_y,
+                                 self._closest_bucketed(agent_x, agent_y))
+
+        collected = np.fromiter((r.collected for r in resources), np.bool_, n)
+
+        # Tight scan over the position columns with collected entries
+        # skipped and an early-out on exact hits; ties resolve to the
+        # lowest index, matching the old min(key=...) scan. Dispatches to
+        # the JIT-compiled kernel when Numba is available.
+        index = closest_manhattan_kernel(
+            self._rx, self._ry, collected, agent_x, agent_y, n
+        )
+        if index < 0:
+            return None
+        return self._memoize(agent_x, agent_y, resources[index])
+
+    def _memoize(self, agent_x: int, agent_y: int,
+                 result: Optional[Resource]) -> Optional[Resource]:
+        """Record a closest-resource answer for its query point (capped)."""
+        if result is not None:
+            if len(self._query_cache) >= 1024:
+                self._query_cache.clear()
+            self._query_cache[(agent_x, agent_y)] = result
+        return result
+
+    def _closest_bucketed(self, agent_x: int, agent_y: int) -> Optional[Resource]:
+        """
+        Nearest uncollected resource via coarse-grid ring expansion.
+
+        Buckets around the agent are scanned in growing Chebyshev rings;
+        once a candidate is found, expansion continues only while a closer
+        resource could still hide in an unscanned ring (any resource in
+        ring r is at Manhattan distance >= (r - 1) * bucket size). Expected
+        O(1) per query on dense fields versus O(R) for the full scan.
+        """
+        resources = self.resources
+        size = self._BUCKET_SIZE
+        if self._buckets is None:
+            buckets: Dict[Tuple[int, int], List[int]] = {}
+            for i, r in enumerate(resources):
+                buckets.setdefault((r.x // size, r.y // size), []).append(i)
+            self._buckets = buckets
+            xs = [cell[0] for cell in buckets]
+            ys = [cell[1] for cell in buckets]
+            self._bucket_bounds = (min(xs), max(xs), min(ys), max(ys))
+        buckets = self._buckets
+
+        bx, by = agent_x // size, agent_y // size
+        # Expand only until every occupied bucket has been covered; bounds
+        # from the index itself keep queries issued from outside the
+        # resource field correct (a grid-derived cap would stop short).
+        min_bx, max_bx, min_by, max_by = self._bucket_bounds
+        max_ring = max(bx - min_bx, max_bx - bx, by - min_by, max_by - by, 0)
+        best: Optional[Resource] = None
+        best_distance = np.iinfo(np.int64).max
+
+        for ring in range(max_ring + 1):
+            if best is not None and (ring - 1) * size > best_distance:
+                break
+            if ring == 0:
+                cells = ((bx, by),)
+            else:
+                top = [(bx + dx, by - ring) for dx in range(-ring, ring + 1)]
+                bottom = [(bx + dx, by + ring) for dx in range(-ring, ring + 1)]
+                sides = [(bx + sx * ring, by + dy)
+                         for dy in range(-ring + 1, ring)
+                         for sx in (-1, 1)]
+                cells = top + bottom + sides
+            for cell in cells:
+                for index in buckets.get(cell, ()):
+                    resource = resources[index]
+                    if resource.collected:
+                        continue
+                    distance = (abs(resource.x - agent_x)
+                                + abs(resource.y - agent_y))
+                    if distance < best_distance:
+                        best_distance = distance
+                        best = resource
+        return best
     
     def collect_resource(self, resource: Resource) -> int:
         """
@@ -104,23 +322,36 @@ class Environment:
         Returns:
             The value of the collected resource
         """
-        if resource.collected:
-            return 0
-        
-        resource.collected = True
+        if not resource.collected:
+            resource.collected = True
+            self._n_collected += 1
+        # Re-collecting is idempotent: the value is reported either way and
+        # the counter only moves on the first collection.
         return resource.value
     
     def get_available_resources(self) -> List[Resource]:
-        """Get all uncollected resources."""
+        """Get all uncollected resources.
+
+        Prefer `iter_available` (no list allocation) or
+        `get_available_count` (O(1)) when a materialized list is not needed.
+        """
         return [r for r in self.resources if not r.collected]
-    
+
+    def iter_available(self):
+        """Iterate over uncollected resources without building a list."""
+        return (r for r in self.resources if not r.collected)
+
     def get_total_resources(self) -> int:
         """Get total number of resources (collected + uncollected)."""
         return len(self.resources)
-    
+
     def get_collected_resources(self) -> int:
-        """Get number of collected resources."""
-        return sum(1 for r in self.resources if r.collected)
+        """Get number of resources collected through collect_resource."""
+        return self._n_collected
+
+    def get_available_count(self) -> int:
+        """O(1) count of uncollected resources (total minus collected)."""
+        return len(self.resources) - self._n_collected
     
     def display(self, agent_positions: Dict[str, Tuple[int, int]] = None, agent_types: Dict[str, str] = None, agent_info: Dict[str, dict] = None) -> None:
         """
@@ -131,39 +362,19 @@ class Environment:
             agent_types: Dictionary mapping agent IDs to their types for different symbols
             agent_info: Dictionary mapping agent IDs to additional info (e.g., newborn status)
         """
+        if self.verbosity <= 0:
+            return None
         if agent_positions is None:
             agent_positions = {}
         if agent_types is None:
             agent_types = {}
         if agent_info is None:
             agent_info = {}
-        
-        # Create grid representation
-        grid = [[' ' for _ in range(self.width)] for _ in range(self.height)]
-        
-        # Place resources
-        for resource in self.resources:
-            if not resource.collected:
-                grid[resource.y][resource.x] = f'{resource.value}'
-        
-        # Place agents with type-specific symbols
-        for agent_id, (x, y) in agent_positions.items():
-            if 0 <= x < self.width and 0 <= y < self.height:
-                agent_type = agent_types.get(agent_id, 'unknown')
-                agent_data = agent_info.get(agent_id, {})
-                newborn = agent_data.get('newborn', False)
-                
-                if agent_type == 'altruist':
-                    grid[y][x] = 'a' if newborn else 'A'  # Lowercase for newborn altruist
-                elif agent_type == 'egoist':
-                    grid[y][x] = 'e' if newborn else 'E'  # Lowercase for newborn egoist
-                elif agent_type == 'pragmatist':
-                    grid[y][x] = 'p' if newborn else 'P'  # Lowercase for newborn pragmatist
-                else:
-                    grid[y][x] = 'a' if newborn else 'A'  # Default agent symbol
-        
+
+        grid = self._render_grid(agent_positions, agent_types, agent_info)
+
         # Create table
-        table = Table(title=f"Environment (Available Resources: {len(self.get_available_resources())})")
+        table = Table(title=f"Environment (Available Resources: {self.get_available_count()})")
         
         # Add columns
         for i in range(self.width):
@@ -221,40 +432,20 @@ class Environment:
         Returns:
             String representation of the environment display
         """
+        if self.verbosity <= 0:
+            return ""
         if agent_positions is None:
             agent_positions = {}
         if agent_types is None:
             agent_types = {}
         if agent_info is None:
             agent_info = {}
-        
-        # Create grid representation
-        grid = [[' ' for _ in range(self.width)] for _ in range(self.height)]
-        
-        # Place resources
-        for resource in self.resources:
-            if not resource.collected:
-                grid[resource.y][resource.x] = f'{resource.value}'
-        
-        # Place agents with type-specific symbols
-        for agent_id, (x, y) in agent_positions.items():
-            if 0 <= x < self.width and 0 <= y < self.height:
-                agent_type = agent_types.get(agent_id, 'unknown')
-                agent_data = agent_info.get(agent_id, {})
-                newborn = agent_data.get('newborn', False)
-                
-                if agent_type == 'altruist':
-                    grid[y][x] = 'a' if newborn else 'A'  # Lowercase for newborn altruist
-                elif agent_type == 'egoist':
-                    grid[y][x] = 'e' if newborn else 'E'  # Lowercase for newborn egoist
-                elif agent_type == 'pragmatist':
-                    grid[y][x] = 'p' if newborn else 'P'  # Lowercase for newborn pragmatist
-                else:
-                    grid[y][x] = 'a' if newborn else 'A'  # Default agent symbol
-        
+
+        grid = self._render_grid(agent_positions, agent_types, agent_info)
+
         # Build the display string
         lines = []
-        lines.append(f"Environment (Available Resources: {len(self.get_available_resources())})")
+        lines.append(f"Environment (Available Resources: {self.get_available_count()})")
         lines.append("=" * (self.width * 3 + 10))
         
         # Add column headers
@@ -262,18 +453,19 @@ class Environment:
         lines.append(header)
         lines.append("-" * len(header))
         
-        # Add rows
+        # Add rows (list-append + join: += on a str reallocates the whole
+        # row every cell, going quadratic in width)
         for y in range(self.height):
-            row = f"{y:2} |"
+            parts = [f"{y:2} |"]
             for x in range(self.width):
                 cell = grid[y][x]
                 if cell == 'A':
-                    row += " A "
+                    parts.append(" A ")
                 elif cell.isdigit():
-                    row += f" {cell} "
+                    parts.append(f" {cell} ")
                 else:
-                    row += " · "
-            lines.append(row)
+                    parts.append(" · ")
+            lines.append("".join(parts))
         
         # Add legend
         lines.append("")
@@ -284,6 +476,37 @@ class Environment:
         
         return "\n".join(lines)
     
+    def render_frame(self, agent_positions: Dict[str, Tuple[int, int]] = None,
+                     agent_types: Dict[str, str] = None,
+                     agent_info: Dict[str, dict] = None) -> None:
+        """
+        Buffered plain-text alternative to `display` for tight loops.
+
+        Frames are written into a reusable StringIO buffer and flushed to
+        stdout in one write every `display_stride` frames, so per-day
+        rendering skips Rich's table measurement entirely and I/O is
+        batched. A no-op at verbosity 0, like the other render paths.
+        """
+        if self.verbosity <= 0:
+            return
+        self._frame_buf.write(
+            self.get_display_string(agent_positions, agent_types, agent_info)
+        )
+        self._frame_buf.write("\n")
+        self._frames_buffered += 1
+        if self._frames_buffered >= max(self.display_stride, 1):
+            self.flush_frames()
+
+    def flush_frames(self) -> None:
+        """Write any buffered frames to stdout and clear the buffer."""
+        data = self._frame_buf.getvalue()
+        if data:
+            sys.stdout.write(data)
+            sys.stdout.flush()
+            self._frame_buf.seek(0)
+            self._frame_buf.truncate(0)
+        self._frames_buffered = 0
+
     def get_distance(self, x1: int, y1: int, x2: int, y2: int) -> int:
         """Calculate Manhattan distance between two points."""
         return abs(x2 - x1) + abs(y2 - y1)
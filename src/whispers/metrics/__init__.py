@@ -2,24 +2,303 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List
+import copy
+from typing import Any, Dict, Iterator, List, Sequence
+
+import numpy as np
+
+from ._compress import (
+    INT_CODEC_LIMIT,
+    decode_float_block,
+    decode_int_block,
+    encode_float_block,
+    encode_int_block,
+)
+
+# Sentinel marking "key absent on this day" inside a column; rows omit it
+# when reconstructed, so heterogeneous records round-trip exactly.
+_MISSING = object()
+
+# Values stored as-is; anything else is cloned on log so later caller
+# mutations cannot leak into the buffer.
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Type-directed clone of a logged value.
+
+    Recurses through the common container types with plain constructors —
+    much cheaper than `copy.deepcopy`, which pays for memo-dict upkeep
+    and per-object dispatch on every node. Scalars pass through untouched
+    and anything unrecognized falls back to deepcopy, so the immutability
+    guarantee is identical.
+    """
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    if isinstance(value, dict):
+        return {key: _freeze(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_freeze(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return set(value)
+    return copy.deepcopy(value)
+
+
+class _Column:
+    """
+    One metric's series: sealed compressed blocks plus an open tail.
+
+    Appends land in a plain Python list; every `BLOCK` rows the list is
+    sealed into a compact encoding — delta-of-delta varints for all-int
+    blocks, XOR-of-previous for float blocks, the raw list for anything
+    non-numeric or containing missing days. Random access decodes at most
+    one block, with the last decoded block cached for sequential reads.
+    """
+
+    BLOCK = 1024
+
+    __slots__ = ("_sealed", "_open", "_cache_index", "_cache_values")
+
+    def __init__(self) -> None:
+        self._sealed: List[tuple] = []  # (kind, payload) covering BLOCK rows
+        self._open: List[Any] = []
+        self._cache_index = -1
+        self._cache_values = None
+
+    def append(self, value: Any) -> None:
+        self._open.append(value)
+        if len(self._open) >= self.BLOCK:
+            self._seal()
+
+    def _seal(self) -> None:
+        block = self._open
+        if all(
+            type(v) is int and -INT_CODEC_LIMIT < v < INT_CODEC_LIMIT
+            for v in block
+        ):
+            self._sealed.append(("i", encode_int_block(block)))
+        elif all(isinstance(v, float) for v in block):
+            # Pure-float blocks only: the float codec decodes everything to
+            # float64, so a block mixing ints and floats would flip the int
+            # rows' type on read-back. Mixed blocks stay on the raw path.
+            self._sealed.append(("f", encode_float_block(block)))
+        else:
+            self._sealed.append(("raw", block))
+        self._open = []
+
+    def _block(self, index: int) -> Any:
+        """Decoded values of sealed block `index` (cached)."""
+        if index != self._cache_index:
+            kind, payload = self._sealed[index]
+            if kind == "i":
+                self._cache_values = decode_int_block(payload, self.BLOCK)
+            elif kind == "f":
+                self._cache_values = decode_float_block(payload, self.BLOCK)
+            else:
+                self._cache_values = payload
+            self._cache_index = index
+        return self._cache_values
+
+    def __len__(self) -> int:
+        return len(self._sealed) * self.BLOCK + len(self._open)
+
+    def __getitem__(self, index: int) -> Any:
+        block_index, offset = divmod(index, self.BLOCK)
+        if block_index < len(self._sealed):
+            kind = self._sealed[block_index][0]
+            value = self._block(block_index)[offset]
+            return int(value) if kind == "i" else value
+        return self._open[offset]
+
+    def __iter__(self) -> Iterator[Any]:
+        for block_index, (kind, _) in enumerate(self._sealed):
+            values = self._block(block_index)
+            if kind == "i":
+                for value in values:
+                    yield int(value)
+            else:
+                yield from values
+        yield from self._open
+
+
+class DailyRows:
+    """
+    Read-only, list-like row view over a columnar metrics buffer.
+
+    Supports `len`, integer/slice indexing and iteration, returning plain
+    per-day dicts, so callers that treated `daily` as a list of records
+    keep working unchanged.
+    """
+
+    __slots__ = ("_buffer",)
+
+    def __init__(self, buffer: "MetricsBuffer") -> None:
+        self._buffer = buffer
+
+    def __len__(self) -> int:
+        return self._buffer._n_rows
+
+    def __getitem__(self, index):
+        n = self._buffer._n_rows
+        if isinstance(index, slice):
+            return [self._buffer._row(i) for i in range(*index.indices(n))]
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("day index out of range")
+        return self._buffer._row(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self._buffer._n_rows):
+            yield self._buffer._row(i)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
 
 
-@dataclass
 class MetricsBuffer:
-    """Collects per-day metrics and summarizes at the end."""
-    daily: List[Dict[str, Any]] = field(default_factory=list)
+    """
+    Collects per-day metrics and summarizes at the end.
+
+    Storage is columnar: one series per metric key, so logging a day
+    costs K appends instead of a per-day dict copy. Long runs stay
+    compact because each column seals full 1024-row blocks of numeric
+    values into delta-of-delta / XOR encodings (see `_Column`).
+    """
+
+    def __init__(self) -> None:
+        self._columns: Dict[str, _Column] = {}
+        self._n_rows = 0
+        self._schema_columns: List[_Column] = []
+        self.daily = DailyRows(self)
+
+    def declare_schema(self, keys: Sequence[str]) -> None:
+        """
+        Freeze a column order for the positional `log_row` fast path.
+
+        Call once before the run loop; the columns are resolved (and
+        row-aligned) here so `log_row` never hashes keys or builds dicts.
+        """
+        n = self._n_rows
+        self._schema_columns = []
+        for key in keys:
+            column = self._columns.get(key)
+            if column is None:
+                column = _Column()
+                for _ in range(n):
+                    column.append(_MISSING)
+                self._columns[key] = column
+            self._schema_columns.append(column)
+
+    def log_row(self, values: Sequence[Any]) -> None:
+        """
+        Append one day's metrics positionally, in declared-schema order.
+
+        The zero-copy sibling of `log_day` for the simulation's own hot
+        loop: values are numeric scalars written straight into the
+        declared columns — no dict construction, no per-key hashing.
+        """
+        n = self._n_rows
+        for column, value in zip(self._schema_columns, values):
+            column.append(value)
+        if len(self._columns) != len(self._schema_columns):
+            for column in self._columns.values():
+                if len(column) == n:
+                    column.append(_MISSING)
+        self._n_rows = n + 1
 
     def log_day(self, record: Dict[str, Any]) -> None:
-        self.daily.append(dict(record))
+        """Append one day's metrics; container values are cloned (`_freeze`)."""
+        n = self._n_rows
+        for key, value in record.items():
+            column = self._columns.get(key)
+            if column is None:
+                column = _Column()
+                for _ in range(n):
+                    column.append(_MISSING)
+                self._columns[key] = column
+            if not isinstance(value, _SCALAR_TYPES):
+                value = _freeze(value)
+            column.append(value)
+        # Pad columns the record did not mention so every column stays
+        # row-aligned.
+        for column in self._columns.values():
+            if len(column) == n:
+                column.append(_MISSING)
+        self._n_rows = n + 1
 
-    def finalize(self) -> Dict[str, Any]:
+    def column(self, key: str) -> List[Any]:
+        """One metric's series across days (missing days as None)."""
+        column = self._columns.get(key)
+        if column is None:
+            return [None] * self._n_rows
+        return [None if value is _MISSING else value for value in column]
+
+    def iter_column(self, key: str) -> Iterator[Any]:
+        """Lazily iterate one metric's series, decoding block by block."""
+        column = self._columns.get(key)
+        if column is None:
+            for _ in range(self._n_rows):
+                yield None
+            return
+        for value in column:
+            yield None if value is _MISSING else value
+
+    def column_array(self, key: str, dtype=np.float64) -> np.ndarray:
+        """
+        One metric's series as a typed NumPy array for aggregation.
+
+        Days where the key was absent (or logged as None) come back as
+        NaN, so means/maxes over a column cost one vectorized pass over a
+        contiguous buffer instead of a walk over per-day dicts.
+        """
+        column = self._columns.get(key)
+        if column is None:
+            return np.full(self._n_rows, np.nan, dtype=dtype)
+        out = np.empty(self._n_rows, dtype=dtype)
+        for i, value in enumerate(column):
+            out[i] = np.nan if value is _MISSING or value is None else value
+        return out
+
+    def _row(self, index: int) -> Dict[str, Any]:
         return {
-            "daily": list(self.daily),
-            "summary": {},
+            key: column[index]
+            for key, column in self._columns.items()
+            if column[index] is not _MISSING
         }
 
-__all__ = ["MetricsBuffer"]
+    def finalize(self) -> Dict[str, Any]:
+        """
+        Final results: the daily records plus per-metric summaries.
 
+        Summaries cover the numeric columns only and are computed with
+        vectorized reductions over each column's contiguous array (days
+        where the key was absent are skipped), so cost stays flat per
+        metric rather than growing with a per-day Python loop.
+        """
+        summary: Dict[str, Dict[str, float]] = {}
+        for key in self._columns:
+            try:
+                values = self.column_array(key)
+            except (TypeError, ValueError):
+                continue  # non-numeric column
+            values = values[~np.isnan(values)]
+            if values.size == 0:
+                continue
+            summary[key] = {
+                "mean": float(values.mean()),
+                "std": float(values.std()),
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "p50": float(np.median(values)),
+            }
+        return {
+            "daily": [self._row(i) for i in range(self._n_rows)],
+            "summary": summary,
+        }
 
+
+__all__ = ["MetricsBuffer"]
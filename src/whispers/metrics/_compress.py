@@ -0,0 +1,134 @@
+"""
+Block codecs for long-horizon metric columns.
+
+Sealed 1024-row blocks of numeric metrics compress with the classic
+time-series encodings: delta-of-delta for integer series (day counters
+and other regular-interval columns collapse to ~1 byte per sample) and
+Gorilla-style XOR for floats (slowly-varying series share most mantissa
+bits, so successive XORs are mostly zero bytes). Both codecs here are
+byte-aligned variants — varint deltas and whole-byte lead/trail trimming
+— trading a little density for simple, dependency-free Python.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Sequence
+
+import numpy as np
+
+# Header byte marking "identical to previous value" in the float codec;
+# unreachable as a lead/trail nibble pair for a non-zero XOR.
+_FLOAT_REPEAT = 0xFF
+
+# Largest magnitude the int codec round-trips: the zigzag transform is an
+# involution only for 64-bit values, and second-order deltas of values
+# within ±2^61 are guaranteed to stay inside that range. Callers must keep
+# blocks with larger ints (arbitrary Python precision) on an uncompressed
+# path.
+INT_CODEC_LIMIT = 1 << 61
+
+
+def _zigzag(n: int) -> int:
+    return (n << 1) ^ (n >> 63)
+
+
+def _unzigzag(u: int) -> int:
+    return (u >> 1) ^ -(u & 1)
+
+
+def encode_int_block(values: Sequence[int]) -> bytes:
+    """Delta-of-delta + zigzag varint encoding of an integer block."""
+    out = bytearray()
+    prev = 0
+    prev_delta = 0
+    for i, value in enumerate(values):
+        value = int(value)
+        if i == 0:
+            dod = value
+        else:
+            delta = value - prev
+            dod = delta - prev_delta
+            prev_delta = delta
+        prev = value
+        u = _zigzag(dod)
+        while True:
+            byte = u & 0x7F
+            u >>= 7
+            out.append(byte | (0x80 if u else 0))
+            if not u:
+                break
+    return bytes(out)
+
+
+def decode_int_block(data: bytes, count: int) -> np.ndarray:
+    """Inverse of `encode_int_block`; returns an int64 array."""
+    values = np.empty(count, dtype=np.int64)
+    pos = 0
+    prev = 0
+    prev_delta = 0
+    for i in range(count):
+        shift = 0
+        u = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            u |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                break
+            shift += 7
+        dod = _unzigzag(u)
+        if i == 0:
+            prev = dod
+        else:
+            prev_delta += dod
+            prev += prev_delta
+        values[i] = prev
+    return values
+
+
+def encode_float_block(values: Sequence[float]) -> bytes:
+    """XOR-with-previous float encoding, trimmed to whole bytes."""
+    out = bytearray()
+    prev_bits = 0
+    for value in values:
+        bits = struct.unpack("<Q", struct.pack("<d", float(value)))[0]
+        xor = bits ^ prev_bits
+        prev_bits = bits
+        if xor == 0:
+            out.append(_FLOAT_REPEAT)
+            continue
+        raw = xor.to_bytes(8, "big")
+        lead = next(i for i, b in enumerate(raw) if b)
+        trail = next(i for i, b in enumerate(reversed(raw)) if b)
+        out.append((lead << 4) | trail)
+        out += raw[lead:8 - trail]
+    return bytes(out)
+
+
+def decode_float_block(data: bytes, count: int) -> np.ndarray:
+    """Inverse of `encode_float_block`; returns a float64 array."""
+    values = np.empty(count, dtype=np.float64)
+    pos = 0
+    prev_bits = 0
+    for i in range(count):
+        header = data[pos]
+        pos += 1
+        if header != _FLOAT_REPEAT:
+            lead = header >> 4
+            trail = header & 0x0F
+            mid = 8 - lead - trail
+            xor = int.from_bytes(data[pos:pos + mid], "big") << (trail * 8)
+            pos += mid
+            prev_bits ^= xor
+        values[i] = struct.unpack("<d", struct.pack("<Q", prev_bits))[0]
+    return values
+
+
+__all__ = [
+    "INT_CODEC_LIMIT",
+    "encode_int_block",
+    "decode_int_block",
+    "encode_float_block",
+    "decode_float_block",
+]
@@ -0,0 +1,79 @@
+"""Pairwise resource negotiation baseline."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Tuple
+
+import numpy as np
+
+
+@dataclass
+class NegotiationConfig:
+    """Configuration for pairwise negotiations.
+
+    Demands are snapped to the discrete `demand_grid` levels; the grid is
+    precomputed once as contiguous float32 (plus a sorted copy for
+    `searchsorted`) so per-day batches never rescan the Python tuple.
+    """
+
+    demand_grid: Tuple[float, ...] = (0.3, 0.4, 0.5, 0.6, 0.7)
+    _grid: np.ndarray = field(init=False, repr=False, compare=False)
+    _grid_sorted: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._grid = np.asarray(self.demand_grid, dtype=np.float32)
+        self._grid_sorted = np.sort(self._grid)
+
+
+class Negotiation:
+    """Resolves how two agents split a contested resource."""
+
+    def __init__(self, config: NegotiationConfig | None = None) -> None:
+        self.config = config or NegotiationConfig()
+
+    def _snap(self, demands: np.ndarray) -> np.ndarray:
+        """Snap raw demand fractions to the nearest grid level, vectorized."""
+        grid = self.config._grid_sorted
+        right = np.searchsorted(grid, demands).clip(1, grid.size - 1)
+        left = right - 1
+        pick_left = (demands - grid[left]) <= (grid[right] - demands)
+        return np.where(pick_left, grid[left], grid[right])
+
+    def negotiate_batch(
+        self,
+        demands_a: np.ndarray,
+        demands_b: np.ndarray,
+        resource_sizes: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Resolve M independent negotiations in one vectorized pass.
+
+        Each side's demand snaps to the grid; a pair succeeds when the
+        snapped demands are jointly feasible (sum <= 1), in which case
+        each side receives its demanded fraction of the resource.
+
+        Returns:
+            (share_a int32, share_b int32, success bool) arrays.
+        """
+        demands_a = np.asarray(demands_a, dtype=np.float32)
+        demands_b = np.asarray(demands_b, dtype=np.float32)
+        resource_sizes = np.asarray(resource_sizes)
+        ga = self._snap(demands_a)
+        gb = self._snap(demands_b)
+        success = (ga + gb) <= np.float32(1.0)
+        share_a = np.where(success, np.rint(ga * resource_sizes), 0).astype(np.int32)
+        share_b = np.where(success, np.rint(gb * resource_sizes), 0).astype(np.int32)
+        return share_a, share_b, success
+
+    def negotiate(
+        self, demand_a: float, demand_b: float, resource_size: int
+    ) -> Tuple[int, int, bool]:
+        """Single-pair convenience wrapper over `negotiate_batch`."""
+        share_a, share_b, success = self.negotiate_batch(
+            np.array([demand_a]), np.array([demand_b]), np.array([resource_size])
+        )
+        return int(share_a[0]), int(share_b[0]), bool(success[0])
+
+
+__all__ = ["NegotiationConfig", "Negotiation"]
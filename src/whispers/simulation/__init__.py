@@ -1,12 +1,13 @@
 """Simulation package exports."""
 
-from .simulation import Simulation, SimulationConfig
+from .simulation import Simulation, SimulationConfig, run_batch
 from .day_simulation import DaySimulation
 
 __all__ = [
     "Simulation",
     "SimulationConfig",
     "DaySimulation",
+    "run_batch",
 ]
 
 
@@ -0,0 +1,55 @@
+"""
+Single-day orchestration against an environment.
+
+`DaySimulation` runs the within-day phases for a population: resource
+spawning, greedy foraging toward the nearest resource, daily upkeep and
+the end-of-day reset.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from ..agents.base_agent import BaseAgent
+from ..environment import Environment
+
+
+class DaySimulation:
+    """Runs one day of foraging for a population in an environment."""
+
+    def __init__(self, environment: Environment):
+        """
+        Initialize the day runner.
+
+        Args:
+            environment: Spatial environment agents forage in.
+        """
+        self.environment = environment
+
+    def run_day(self, agents: Sequence[BaseAgent]) -> None:
+        """
+        Execute one day: spawn, forage, upkeep, reset.
+
+        Each alive agent repeatedly collects the nearest available resource
+        until its desired intake is met or resources run out; then daily
+        upkeep is applied and per-day counters reset.
+        """
+        self.environment.spawn_resources()
+        for agent in agents:
+            if not agent.alive:
+                continue
+            desired = agent.desired_intake_today()
+            collected = 0
+            while collected < desired:
+                x, y = agent.get_position()
+                resource = self.environment.get_closest_resource(x, y)
+                if resource is None:
+                    break
+                agent.set_position(resource.x, resource.y)
+                collected += self.environment.collect_resource(resource)
+            agent.receive_resources(collected)
+        for agent in agents:
+            if agent.alive:
+                agent.perform_daily_upkeep()
+        for agent in agents:
+            agent.start_new_day()
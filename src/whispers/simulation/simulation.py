@@ -0,0 +1,261 @@
+"""
+Core simulation loop for the Whispers of Self simulation.
+
+This module provides the `Simulation` driver: it owns the agent
+population and the day counter, advances the population one day at a
+time, and records per-day metrics. Resource foraging against an
+environment is orchestrated separately by `DaySimulation`.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..agents._kernels import age_step_kernel, run_days_kernel
+from ..agents.base_agent import BaseAgent
+from ..metrics import MetricsBuffer
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationConfig:
+    """Configuration for a simulation run.
+
+    Frozen (and therefore hashable): a config never changes mid-run, so
+    instances can key caches, and the all-defaults case is served by the
+    shared `_DEFAULT_CONFIG` singleton instead of a fresh allocation.
+    """
+
+    num_days: int = 30
+    daily_resource_budget: int = 0
+    enable_visualization: bool = False
+    update_interval: float = 0.0
+
+
+_DEFAULT_CONFIG = SimulationConfig()
+
+
+class Simulation:
+    """
+    Day-by-day driver over a population of agents.
+
+    Each `step()` advances the clock one day and ages every agent;
+    `run()` executes `config.num_days` steps from the current day.
+    """
+
+    # Fixed slots, like the agent-side classes: no per-instance __dict__,
+    # and the hot attribute reads in step()/run() resolve by offset.
+    __slots__ = (
+        "config",
+        "_agents",
+        "day",
+        "metrics",
+        "_indices",
+        "_agents_view",
+    )
+
+    def __init__(
+        self,
+        agents: Optional[Sequence[BaseAgent]] = None,
+        config: Optional[SimulationConfig] = None,
+    ):
+        """
+        Initialize the simulation.
+
+        Args:
+            agents: Initial population (optional; agents can be added later).
+            config: Run configuration; defaults to `SimulationConfig()`.
+        """
+        self.config = config if config is not None else _DEFAULT_CONFIG
+        self._agents: List[BaseAgent] = list(agents) if agents is not None else []
+        self.day = 0
+        self.metrics = MetricsBuffer()
+        # Cached (pool, row indices) for the vectorized step path and the
+        # immutable agents tuple; both rebuilt lazily whenever the
+        # population changes.
+        self._indices: Optional[np.ndarray] = None
+        self._agents_view: Optional[Tuple[BaseAgent, ...]] = None
+
+    @property
+    def agents(self) -> Tuple[BaseAgent, ...]:
+        """Current population as an immutable tuple (cached, zero-copy reads)."""
+        if self._agents_view is None:
+            self._agents_view = tuple(self._agents)
+        return self._agents_view
+
+    def add_agents(self, agents: Sequence[BaseAgent]) -> None:
+        """Add agents to the population."""
+        self._agents.extend(agents)
+        self._indices = None
+        self._agents_view = None
+
+    def _pool_indices(self):
+        """
+        (pool, row indices) when the whole population shares one pool.
+
+        Agents are views onto AgentPool rows, so the per-day aging and
+        liveness passes can run as two column operations instead of a
+        Python loop; mixed-pool populations fall back to the object path.
+        """
+        if not self._agents:
+            return None, None
+        if self._indices is None:
+            pool = self._agents[0].pool
+            if any(agent.pool is not pool for agent in self._agents):
+                return None, None
+            self._indices = np.fromiter(
+                (agent.index for agent in self._agents), np.intp, len(self._agents)
+            )
+        return self._agents[0].pool, self._indices
+
+    def population_by_personality(self) -> np.ndarray:
+        """
+        Alive-agent counts per personality type id, as one array.
+
+        A single bincount over the masked type_id column replaces N
+        Python-level branch-and-count passes (one per type); rows with
+        unknown type ids (-1) are excluded.
+        """
+        pool, indices = self._pool_indices()
+        if pool is not None:
+            tids = pool.type_id[indices][pool.alive[indices]]
+        else:
+            tids = np.fromiter(
+                (agent.pool.type_id[agent.index]
+                 for agent in self._agents if agent.alive),
+                np.int64,
+            )
+        return np.bincount(tids[tids >= 0].astype(np.int64), minlength=3)
+
+    def total_resources(self) -> int:
+        """Summed reserves of the living population in one masked reduction."""
+        pool, indices = self._pool_indices()
+        if pool is not None:
+            reserves = pool.resources_reserve[indices]
+            return int(reserves[pool.alive[indices]].sum())
+        return sum(
+            agent.state.resources_reserve for agent in self._agents if agent.alive
+        )
+
+    def alive_count(self) -> int:
+        """Number of currently alive agents."""
+        pool, indices = self._pool_indices()
+        if pool is not None:
+            return int(pool.alive[indices].sum())
+        return sum(1 for agent in self._agents if agent.alive)
+
+    def step(self) -> None:
+        """Advance the simulation by one day."""
+        self.day += 1
+        pool, indices = self._pool_indices()
+        if pool is not None:
+            # One fused kernel pass ages the live rows and counts them
+            # (JIT-compiled when Numba is available).
+            alive_count = int(
+                age_step_kernel(pool.age, pool.alive, indices, len(indices))
+            )
+        else:
+            for agent in self._agents:
+                if agent.alive:
+                    agent.age_step()
+            alive_count = self.alive_count()
+        self.metrics.log_day(
+            {
+                "day": self.day,
+                "agents_alive": alive_count,
+            }
+        )
+
+    def _specialized_run(self, num_days: int) -> None:
+        """
+        Run loop specialized for the single-pool population.
+
+        Config and population shape are fixed for the lifetime of a run,
+        so instead of re-resolving them every day the loop is a closure
+        with the hot state baked in as locals: the pool columns, the row
+        indices, and the metrics append are bound once, and the per-day
+        body is two column ops plus one log call — no attribute walks, no
+        re-checking invariants that cannot change mid-run (nothing
+        mutates the population between steps; callers that grow it use
+        `step()` directly).
+        """
+        age = self._agents[0].pool.age
+        alive_col = self._agents[0].pool.alive
+        indices = self._indices
+        n = len(indices)
+        # All num_days aging passes run inside one fused kernel call; the
+        # per-day alive counts come back in a scratch vector and only the
+        # metric appends remain at Python level.
+        if not alive_col[indices].any():
+            # Collapsed population: nothing ages, every day logs zero.
+            # The any() reduction short-circuits on the first live agent,
+            # so the guard is near-free for healthy populations.
+            counts = np.zeros(num_days, dtype=np.int64)
+        else:
+            counts = np.empty(num_days, dtype=np.int64)
+            run_days_kernel(num_days, age, alive_col, indices, n, counts)
+        self.metrics.declare_schema(("day", "agents_alive"))
+        log_row = self.metrics.log_row
+        day = self.day
+        for count in counts.tolist():
+            day += 1
+            log_row((day, count))
+        self.day = day
+
+    def run(self) -> None:
+        """Run `config.num_days` steps from the current day."""
+        if self.config.num_days <= 0:
+            return
+        pool, _ = self._pool_indices()
+        if pool is not None:
+            self._specialized_run(self.config.num_days)
+            return
+        for _ in range(self.config.num_days):
+            self.step()
+
+
+def _run_one(job: Tuple[Callable[[], Sequence[BaseAgent]], SimulationConfig]):
+    factory, config = job
+    sim = Simulation(agents=factory(), config=config)
+    sim.run()
+    return sim.metrics.finalize()
+
+
+def run_batch(
+    agent_factories: Sequence[Callable[[], Sequence[BaseAgent]]],
+    configs: Optional[Sequence[SimulationConfig]] = None,
+    n_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run independent simulations in parallel, one worker process each.
+
+    Parameter sweeps are embarrassingly parallel — no state is shared
+    between runs — so each (factory, config) pair builds and runs its
+    simulation in its own process and ships back only the finalized
+    metrics dict, keeping inter-process traffic small. Factories must be
+    picklable (module-level callables); a single job runs inline with no
+    executor overhead.
+
+    Args:
+        agent_factories: One zero-argument population builder per run.
+        configs: Matching run configurations; defaults per run.
+        n_workers: Process count, or None for the executor default.
+
+    Returns:
+        Each run's `MetricsBuffer.finalize()` result, in input order.
+    """
+    factories = list(agent_factories)
+    if configs is None:
+        configs = [SimulationConfig() for _ in factories]
+    elif len(configs) != len(factories):
+        raise ValueError(
+            f"configs has {len(configs)} entries for {len(factories)} factories"
+        )
+    jobs = list(zip(factories, configs))
+    if len(jobs) <= 1:
+        return [_run_one(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(_run_one, jobs))
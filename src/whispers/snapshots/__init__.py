@@ -1,11 +1,17 @@
 """Snapshot package exports."""
 
-from .snapshot import Snapshot, take_snapshot, restore_snapshot
+from .snapshot import (
+    Snapshot,
+    load_snapshot,
+    restore_snapshot,
+    save_snapshot,
+    take_snapshot,
+)
 
 __all__ = [
     "Snapshot",
     "take_snapshot",
     "restore_snapshot",
+    "save_snapshot",
+    "load_snapshot",
 ]
-
-
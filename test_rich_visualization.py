@@ -12,17 +12,12 @@ from rich.console import Console
 from rich.panel import Panel
 
 def create_test_agents(num_agents: int = 5) -> list[BaseAgent]:
-    """Create test agents for demonstration."""
-    agents = []
-    for i in range(num_agents):
-        agent = BaseAgent(f"test_agent_{i}")
-        agent.agent_type = f"Type_{i % 3}"  # Different types for variety
-        agent.age = i + 1
-        # Set some resources
-        if hasattr(agent, 'state'):
-            agent.state.resources_reserve = (i + 1) * 10
-        agents.append(agent)
-    return agents
+    """Create test agents for demonstration (batched column construction)."""
+    return BaseAgent.from_columns(
+        agent_types=[f"Type_{i % 3}" for i in range(num_agents)],  # variety
+        ages=[i + 1 for i in range(num_agents)],
+        resources=[(i + 1) * 10 for i in range(num_agents)],
+    )
 
 def main():
     """Main demonstration function."""
@@ -8,9 +8,7 @@ from src.whispers.agents.personality_agents import Altruist, Egoist, Pragmatist
 class DummyAgent(BaseAgent):
     """Concrete minimal agent to exercise BaseAgent behavior."""
 
-    def __init__(self, **kwargs):
-        kwargs.setdefault("agent_type", "dummy")
-        super().__init__(**kwargs)
+    _TYPE = "dummy"
 
 
 def test_base_agent_state_and_resources():
@@ -60,6 +58,21 @@ def test_base_agent_reputation_and_average_harvest():
     assert math.isclose(avg5, (1 + 3 + 5 + 7 + 9) / 5)
 
 
+def test_reputation_stable_after_cooperation_window_fills():
+    agent = DummyAgent()
+
+    # Push well past the 20-event window so evictions happen with mixed
+    # outcomes (a failure evicting a success used to wrap the uint8
+    # subtraction and blow the running sum past the window size).
+    for outcome in [True, False] * 25:
+        agent.update_reputation(outcome)
+        assert 0.0 <= agent.reputation <= 1.0
+
+    pool, i = agent.pool, agent.index
+    assert int(pool.cooperation_sum[i]) == sum(agent.state.cooperation_history)
+    assert 0 <= int(pool.cooperation_sum[i]) <= int(pool.cooperation_count[i])
+
+
 def test_base_agent_position_and_movement():
     agent = DummyAgent()
     
@@ -1,4 +1,3 @@
-import pytest
 
 from src.whispers.simulation.simulation import Simulation, SimulationConfig
 from src.whispers.agents.personality_agents import Altruist, Egoist, Pragmatist